@@ -14,19 +14,258 @@ import subprocess
 import sys
 import os
 import re
+import functools
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# All regex patterns used to parse CDP CLI create commands, compiled once at import:
+# - _FLAG_RE: a '--flag' token at the start of the command or after whitespace
+# - _TAGS_RE: one key="...",value="..." pair inside the --tags value
+_FLAG_RE = re.compile(r'(?<!\S)--([A-Za-z][\w-]*)')
+_TAGS_RE = re.compile(r'key="([^"]+)",value="([^"]+)"', re.ASCII)
+
+# Volume types rewritten when copied into a template. Only gp2 is converted
+# to gp3; ephemeral and other types are kept as is.
+_VOLUME_TYPE_REMAP = {"gp2": "gp3"}
+
+# Instance types reported by describe-cluster that map to a non-CORE
+# instance group type
+_INSTANCE_GROUP_TYPE_MAP = {"GATEWAY_PRIMARY": "GATEWAY"}
+
+# Map from --instance-groups override keys to template instance group keys;
+# tuples are paths into nested dicts
+_OVERRIDE_KEY_MAP = {
+    "instanceGroupName": "name",
+    "nodeCount": "nodeCount",
+    "instanceGroupType": "type",
+    "instanceType": ("template", "instanceType"),
+    "attachedVolumeConfiguration": ("template", "attachedVolumes"),
+    "rootVolumeSize": ("template", "rootVolume", "size"),
+    "recipeNames": "recipeNames",
+    "recoveryMode": "recoveryMode",
+}
+
+# Request template values that never depend on the source cluster. They are
+# copied into each generated template, which callers may modify.
+_EXPOSED_SERVICES = ["ALL"]
+_EXTERNAL_DATABASE = {
+    "availabilityType": "HA"
+}
+_STATIC_INPUTS = {
+    "ynlogd.dirs": "/hadoopfs/fs1/nodemanager/log,/hadoopfs/fs2/nodemanager/log",
+    "ynld.dirs": "/hadoopfs/fs1/nodemanager,/hadoopfs/fs2/nodemanager",
+    "dfs.dirs": "/hadoopfs/fs3/datanode,/hadoopfs/fs4/datanode",
+}
+
+# Cloud storage paths written into each template, formatted with the bucket
+# name ({b}) and the cluster name ({c})
+_S3_LOCATIONS = (
+    ("YARN_LOG", "s3a://{b}/datalake/oplogs/yarn-app-logs"),
+    ("ZEPPELIN_NOTEBOOK", "s3a://{b}/datalake/{c}/zeppelin/notebook"),
+)
+_S3_QUERY_DATA_INPUTS = (
+    ("query_data_hive_path", "s3a://{b}/warehouse/tablespace/external/{c}/hive/sys.db/query_data"),
+    ("query_data_tez_path", "s3a://{b}/warehouse/tablespace/external/{c}/hive/sys.db"),
+)
+
+def _run_command(cmd: List[str]) -> bytes:
+    """
+    Run a command and return its standard output.
+    
+    Stdout is kept as bytes, which the JSON parser takes directly, instead of
+    being decoded to a str first. Stderr is spooled to a temporary file so a
+    verbose command cannot block on a full pipe while stdout is being read.
+    
+    Args:
+        cmd (List[str]): Command and arguments to execute
+        
+    Returns:
+        bytes: Standard output of the command
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file) as proc:
+            output = proc.stdout.read()
+        
+        if proc.returncode:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+    
+    return output
+
+def _run_json_command(cmd: List[str]) -> Any:
+    """
+    Run a command and parse its standard output as JSON.
+    
+    Args:
+        cmd (List[str]): Command and arguments to execute
+        
+    Returns:
+        Any: Parsed JSON output of the command
+        
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+        json.JSONDecodeError: If the command output cannot be parsed as JSON
+    """
+    return _json_loads(_run_command(cmd))
+
+def _int_or_str(value: str) -> Union[int, str]:
+    """
+    Convert a CLI value to int, keeping the original string if it is not numeric.
+    
+    Args:
+        value (str): Raw value from a key=value pair
+        
+    Returns:
+        Union[int, str]: Integer value, or the unchanged string
+    """
+    # Predicate checks instead of try/except int(): non-numeric values are
+    # common (e.g. placeholders) and raising is far slower than a str check
+    if value.isdecimal():
+        return int(value)
+    if value[:1] in ("+", "-") and value[1:].isdecimal():
+        return int(value)
+    return value
+
+def _split_list(value: str) -> List[str]:
+    """
+    Split a comma-separated CLI value into a list of non-empty, stripped items.
+    
+    Args:
+        value (str): Raw value from a key=value pair
+        
+    Returns:
+        List[str]: List of items
+    """
+    return [x.strip() for x in value.split(",") if x.strip()]
+
+# Converters applied to --instance-groups override fields; other fields stay strings
+_FIELD_CONVERTERS = {
+    "nodeCount": _int_or_str,
+    "rootVolumeSize": _int_or_str,
+    "recipeNames": _split_list,
+}
+
+@functools.lru_cache(maxsize=128)
+def _describe_cluster_output(cluster_name: str) -> bytes:
+    """
+    Run describe-cluster using CDP CLI, caching the raw output per cluster name.
+    
+    Failed commands raise and are not cached.
+    
+    Args:
+        cluster_name (str): Name of the cluster to describe
+        
+    Returns:
+        bytes: describe-cluster JSON output
+    """
+    return _run_command(["cdp", "datahub", "describe-cluster", "--cluster-name", cluster_name])
+
+def _describe_cluster(cluster_name: str) -> Dict[str, Any]:
+    """
+    Describe a DataHub cluster using CDP CLI.
+    
+    Only the raw CLI output is cached; it is parsed on every call so each
+    caller gets its own dict, which generated templates also point into.
+    
+    Args:
+        cluster_name (str): Name of the cluster to describe
+        
+    Returns:
+        Dict[str, Any]: Cluster data in JSON format
+    """
+    return _json_loads(_describe_cluster_output(cluster_name))
+
+@functools.lru_cache(maxsize=128)
+def _describe_datalake(lookup_arg: str, datalake: str) -> Any:
+    """
+    Describe a datalake using CDP CLI, caching the result per lookup.
+    
+    The cached result is shared between callers and must be treated as read-only.
+    Failed lookups raise and are not cached.
+    
+    Args:
+        lookup_arg (str): CLI argument used to identify the datalake (e.g. "--datalake-crn")
+        datalake (str): Datalake name or CRN
+        
+    Returns:
+        Any: Parsed describe-datalake output
+    """
+    return _run_json_command(["cdp", "datalake", "describe-datalake", lookup_arg, datalake])
+
 class DistroXRequestTemplateGenerator:
     """Generates DistroX request templates from cluster data"""
+    __slots__ = (
+        "_timestamp_names",
+        "_output_dirs",
+        "_cli_command_data",
+        "_override_group_types",
+        "_last_tags",
+    )
+    
     def __init__(self):
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._timestamp_names = None
+        self._output_dirs = {}
+        self._last_tags = None
         self.cli_command_data = None
+    
+    def _get_timestamp_names(self) -> Tuple[str, str, str]:
+        """
+        Get the generation timestamp and the output names derived from it.
+        
+        The timestamp is taken on first use and then stays fixed for the lifetime
+        of the generator, so tags and output paths always agree.
+        
+        Returns:
+            Tuple[str, str, str]: Timestamp, output directory name and template filename suffix
+        """
+        if self._timestamp_names is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._timestamp_names = (
+                timestamp,
+                f"request-template-{timestamp}",
+                f"_template_{timestamp}.json",
+            )
+        return self._timestamp_names
+    
+    @property
+    def timestamp(self) -> str:
+        """Generation timestamp in YYYYMMDD_HHMMSS format"""
+        return self._get_timestamp_names()[0]
+    
+    @property
+    def cli_command_data(self) -> Optional[Dict[str, Any]]:
+        """Parsed CLI command data, or None when no CLI command file was given"""
+        return self._cli_command_data
+    
+    @cli_command_data.setter
+    def cli_command_data(self, value: Optional[Dict[str, Any]]) -> None:
+        self._cli_command_data = value
+        # Precompute instanceGroupType per group name so each instance group
+        # needs a single lookup instead of walking the nested override dicts
+        overrides = value.get("instance_groups_override") if value else None
+        if overrides:
+            self._override_group_types = {
+                name: config.get("instanceGroupType") for name, config in overrides.items()
+            }
+        else:
+            self._override_group_types = None
         
     def get_cluster_data_from_cli(self, cluster_name: str) -> Dict[str, Any]:
         """
@@ -44,10 +283,7 @@ class DistroXRequestTemplateGenerator:
         """
         try:
             logger.info(f"Fetching cluster data for '{cluster_name}' using CDP CLI...")
-            cmd = ["cdp", "datahub", "describe-cluster", "--cluster-name", cluster_name]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            cluster_data = json.loads(result.stdout)
+            cluster_data = _describe_cluster(cluster_name)
             
             logger.info(f"Successfully retrieved data for cluster '{cluster_name}'")
             return cluster_data
@@ -79,8 +315,8 @@ class DistroXRequestTemplateGenerator:
         """
         try:
             logger.info(f"Reading cluster data from file: {file_path}")
-            with open(file_path, 'r') as f:
-                cluster_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                cluster_data = _json_loads(f.read())
             
             logger.info(f"Successfully loaded data from file: {file_path}")
             return cluster_data
@@ -110,8 +346,10 @@ class DistroXRequestTemplateGenerator:
         """
         try:
             logger.info(f"Reading CLI command from file: {cli_file_path}")
+            # The parser ignores surrounding whitespace, so the content is
+            # passed through as read instead of making a stripped copy
             with open(cli_file_path, 'r') as f:
-                cli_content = f.read().strip()
+                cli_content = f.read()
             
             # Parse the CLI command to extract key information
             parsed_data = self._parse_cli_command(cli_content)
@@ -126,6 +364,35 @@ class DistroXRequestTemplateGenerator:
             logger.error(f"Unexpected error reading CLI command file: {e}")
             raise
     
+    def _split_cli_flags(self, cli_command: str) -> Dict[str, str]:
+        """
+        Split a CLI command into its flags and their values in a single scan.
+        
+        A flag is a '--name' token at the start of the command or preceded by
+        whitespace; its value is everything up to the next flag.
+        
+        Args:
+            cli_command (str): Raw CLI command string to split
+            
+        Returns:
+            Dict[str, str]: Flag names (without the leading '--') mapped to their stripped
+                values. Only the first occurrence of a repeated flag is kept.
+        """
+        flags = {}
+        if '--' not in cli_command:
+            return flags
+        
+        name = None
+        value_start = 0
+        for match in _FLAG_RE.finditer(cli_command):
+            if name is not None and name not in flags:
+                flags[name] = cli_command[value_start:match.start()].strip()
+            name = match.group(1)
+            value_start = match.end()
+        if name is not None and name not in flags:
+            flags[name] = cli_command[value_start:].strip()
+        return flags
+    
     def _parse_cli_command(self, cli_command: str) -> Dict[str, Any]:
         """
         Parse CDP CLI command string to extract configuration details.
@@ -151,52 +418,53 @@ class DistroXRequestTemplateGenerator:
             "instance_groups_override": {}
         }
         
-        if '--tags' in cli_command:
-            start_pos = cli_command.find('--tags') + len('--tags')
-            next_dash = cli_command.find('--', start_pos)
-            if next_dash > 0:
-                tags_str = cli_command[start_pos:next_dash].strip()
-            else:
-                tags_str = cli_command[start_pos:].strip()
-
-            logger.debug(f"Found tags string: {tags_str}")
+        flags = self._split_cli_flags(cli_command)
+        
+        tags_str = flags.get("tags")
+        if tags_str is not None:
+            logger.debug("Found tags string: %s", tags_str)
 
             # Some exported CLI files may contain doubled quotes (e.g., key=""k"",value=""v"")
             # Normalize them to single quotes to make regex parsing robust
-            normalized_tags_str = tags_str.replace('""', '"')
+            normalized_tags_str = tags_str.replace('""', '"') if '""' in tags_str else tags_str
 
-            tag_pairs = re.findall(r'key="([^"]+)",value="([^"]+)"', normalized_tags_str)
-            logger.debug(f"Parsed tag pairs: {tag_pairs}")
+            tag_pairs = _TAGS_RE.findall(normalized_tags_str)
+            logger.debug("Parsed tag pairs: %s", tag_pairs)
 
-            for key, value in tag_pairs:
-                parsed["tags"][key] = value
-                logger.debug(f"Added tag: {key} = {value}")
+            parsed["tags"].update(tag_pairs)
         else:
             logger.debug("No --tags found in CLI command")
         
-        subnet_match = re.search(r'--subnet-id\s+(\S+)', cli_command)
-        if subnet_match:
-            parsed["subnet_id"] = subnet_match.group(1)
+        subnet_id = flags.get("subnet-id")
+        if subnet_id:
+            parsed["subnet_id"] = subnet_id.split(None, 1)[0]
         
-        if '--no-multi-az' in cli_command:
+        if "no-multi-az" in flags:
             parsed["multi_az"] = False
-        elif '--multi-az' in cli_command:
+        elif "multi-az" in flags:
             parsed["multi_az"] = True
         
-        if '--no-enable-load-balancer' in cli_command:
+        if "no-enable-load-balancer" in flags:
             parsed["enable_load_balancer"] = False
-        elif '--enable-load-balancer' in cli_command:
+        elif "enable-load-balancer" in flags:
             parsed["enable_load_balancer"] = True
         
-        db_match = re.search(r'--datahub-database\s+(\S+)', cli_command)
-        if db_match:
-            parsed["datahub_database"] = db_match.group(1)
-        
-        instance_groups_match = re.search(r'--instance-groups\s+(.+?)(?=\s+--|\s*$)', cli_command, re.DOTALL)
-        if instance_groups_match:
-            instance_groups_str = instance_groups_match.group(1).strip()
-            logger.debug(f"Extracted instance groups string: {instance_groups_str}")
-            parsed["instance_groups_override"] = self._parse_instance_groups_string(instance_groups_str)
+        datahub_database = flags.get("datahub-database")
+        if datahub_database:
+            parsed["datahub_database"] = datahub_database.split(None, 1)[0]
+        
+        instance_groups_str = flags.get("instance-groups")
+        if instance_groups_str:
+            logger.debug("Extracted instance groups string: %s", instance_groups_str)
+            # Same parser as the --instance-groups argument, keyed by group name
+            instance_groups = {}
+            for group_config in self.parse_instance_groups_argument(instance_groups_str):
+                instance_groups[group_config.get("instanceGroupName", "unknown")] = group_config
+            if logger.isEnabledFor(logging.DEBUG):
+                for group_name, group_config in instance_groups.items():
+                    logger.debug("Added instance group '%s' with config: %s", group_name, group_config)
+            logger.info("Successfully parsed %s instance groups from CLI command", len(instance_groups))
+            parsed["instance_groups_override"] = instance_groups
         else:
             logger.debug("No --instance-groups found in CLI command")
         
@@ -215,35 +483,37 @@ class DistroXRequestTemplateGenerator:
         if not datalake_crn:
             return None
         
-        try:
-            for arg in ["--datalake-name", "--datalake-crn"]:
-                cmd = ["cdp", "datalake", "describe-datalake", arg, datalake_crn]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                data = json.loads(result.stdout)
+        # Each lookup argument is tried on its own so a failure with the first
+        # one still falls back to the second
+        last_error = None
+        for arg in ("--datalake-name", "--datalake-crn"):
+            try:
+                data = _describe_datalake(arg, datalake_crn)
                 
                 if data and "datalake" in data:
                     location = data["datalake"].get("cloudStorageBaseLocation")
                     if location and location.startswith("s3a://"):
                         bucket = location[6:].split("/", 1)[0]
                         return bucket
-        except Exception as e:
-            logger.warning(f"Failed to get bucket name from datalake CRN: {e}")
+            except Exception as e:
+                last_error = e
         
+        if last_error is not None:
+            logger.warning("Failed to get bucket name from datalake CRN: %s", last_error)
         return None
     
-    def parse_instance_groups_argument(self, instance_groups_arg: str) -> List[Dict[str, Any]]:
+    def parse_instance_groups_argument(self, instance_groups_arg: Union[str, List[str]]) -> List[Dict[str, Any]]:
         """
         Parse the --instance-groups argument into a list of instance group configurations.
         
         Args:
-            instance_groups_arg (str): Space-separated string of instance group configurations
+            instance_groups_arg (Union[str, List[str]]): Space-separated string of instance group
+                configurations, or a list of such strings (e.g. the argparse values)
                 Format: "nodeCount=2,instanceGroupName=core,... nodeCount=1,instanceGroupName=worker,..."
             
         Returns:
             List[Dict[str, Any]]: List of parsed instance group configuration dictionaries
         """
-        import ast
-        
         def parse_attached_volumes(val):
             """
             Parse attached volume configuration string.
@@ -257,23 +527,20 @@ class DistroXRequestTemplateGenerator:
             if not val or not val.startswith("[") or not val.endswith("]"):
                 return []
             
-            # Replace = with : and wrap keys/values in quotes for ast.literal_eval
+            # Split into the individual {key=value,...} volume entries
             items = val[1:-1].split("},{")
             result = []
             for item in items:
                 item = item.strip("{}")
                 d = {}
                 for pair in item.split(","):
-                    if "=" in pair:
-                        k, v = pair.split("=", 1)
+                    k, sep, v = pair.partition("=")
+                    if sep:
                         k = k.strip()
                         v = v.strip()
                         # Try to convert to int if possible
                         if k in ("volumeSize", "volumeCount"):
-                            try:
-                                v = int(v)
-                            except Exception:
-                                pass
+                            v = _int_or_str(v)
                         d[k] = v
                 if d:
                     # Map CLI field names to template field names
@@ -288,87 +555,51 @@ class DistroXRequestTemplateGenerator:
                         result.append(mapped_volume)
             return result
 
-        # Split by spaces, each is an instance group
+        # Split by spaces, each is an instance group; every list element (e.g.
+        # from argparse) may itself hold several space-separated groups
+        if isinstance(instance_groups_arg, str):
+            instance_groups_arg = [instance_groups_arg]
+        group_strs = [s for arg in instance_groups_arg for s in arg.strip().split(" ")]
+        
         groups = []
-        for group_str in instance_groups_arg.strip().split(" "):
+        for group_str in group_strs:
             if not group_str.strip():
                 continue
             group = {}
             
             # Handle attachedVolumeConfiguration specially since it contains commas
             # First, extract attachedVolumeConfiguration if present
-            if "attachedVolumeConfiguration=" in group_str:
+            key_pos = group_str.find("attachedVolumeConfiguration=")
+            if key_pos != -1:
                 # Find the start and end of the attachedVolumeConfiguration value
-                start_pos = group_str.find("attachedVolumeConfiguration=") + len("attachedVolumeConfiguration=")
+                start_pos = key_pos + len("attachedVolumeConfiguration=")
                 
-                # Find the matching closing bracket
-                bracket_count = 0
+                # Find the closing bracket; volume lists are never nested
                 end_pos = start_pos
-                for i, char in enumerate(group_str[start_pos:], start_pos):
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_pos = i + 1
-                            break
-                
-                # Extract the volume config and the rest of the string
-                volume_config_str = group_str[start_pos:end_pos]
-                before_volume = group_str[:start_pos-len("attachedVolumeConfiguration=")]
-                after_volume = group_str[end_pos:]
+                if group_str.startswith('[', start_pos):
+                    close_pos = group_str.find(']', start_pos)
+                    if close_pos != -1:
+                        end_pos = close_pos + 1
                 
                 # Parse the volume configuration
-                group["attachedVolumeConfiguration"] = parse_attached_volumes(volume_config_str)
-                
-                # Parse the remaining parts
-                remaining_parts = []
-                if before_volume.strip():
-                    remaining_parts.extend(before_volume.rstrip(",").split(","))
-                if after_volume.strip():
-                    remaining_parts.extend(after_volume.lstrip(",").split(","))
+                group["attachedVolumeConfiguration"] = parse_attached_volumes(group_str[start_pos:end_pos])
                 
-                # Parse remaining key=value pairs
-                for part in remaining_parts:
-                    part = part.strip()
-                    if "=" in part and part:
-                        k, v = part.split("=", 1)
-                        k = k.strip()
-                        v = v.strip()
-                        if k == "nodeCount":
-                            try:
-                                v = int(v)
-                            except Exception:
-                                pass
-                        elif k == "rootVolumeSize":
-                            try:
-                                v = int(v)
-                            except Exception:
-                                pass
-                        elif k == "recipeNames":
-                            v = [x.strip() for x in v.split(",") if x.strip()]
-                        group[k] = v
+                # Cut the volume segment out and split the rest once; the
+                # empty part left by the doubled comma is skipped below
+                remaining_parts = (group_str[:key_pos] + group_str[end_pos:]).split(",")
             else:
                 # No attachedVolumeConfiguration, parse normally
-                for pair in group_str.split(","):
-                    if "=" not in pair:
-                        continue
-                    k, v = pair.split("=", 1)
-                    k = k.strip()
-                    v = v.strip()
-                    if k == "nodeCount":
-                        try:
-                            v = int(v)
-                        except Exception:
-                            pass
-                    elif k == "rootVolumeSize":
-                        try:
-                            v = int(v)
-                        except Exception:
-                            pass
-                    elif k == "recipeNames":
-                        v = [x.strip() for x in v.split(",") if x.strip()]
-                    group[k] = v
+                remaining_parts = group_str.split(",")
+            
+            # Parse key=value pairs, converting fields that need a typed value
+            for part in remaining_parts:
+                k, sep, v = part.partition("=")
+                if not sep:
+                    continue
+                k = k.strip()
+                v = v.strip()
+                converter = _FIELD_CONVERTERS.get(k)
+                group[k] = converter(v) if converter else v
             
             groups.append(group)
         return groups
@@ -386,27 +617,15 @@ class DistroXRequestTemplateGenerator:
         """
         merged = template_group.copy()
         
-        logger.info(f"Overriding instance group '{template_group.get('name', 'unknown')}' with: {override_group}")
-        
-        # Map from override_group keys to template_group keys
-        key_map = {
-            "instanceGroupName": "name",
-            "nodeCount": "nodeCount",
-            "instanceGroupType": "type",
-            "instanceType": ("template", "instanceType"),
-            "attachedVolumeConfiguration": ("template", "attachedVolumes"),
-            "rootVolumeSize": ("template", "rootVolume", "size"),
-            "recipeNames": "recipeNames",
-            "recoveryMode": "recoveryMode",
-        }
+        logger.info("Overriding instance group '%s' with: %s", template_group.get('name', 'unknown'), override_group)
         
         for k, v in override_group.items():
-            if k not in key_map:
-                logger.debug(f"Skipping unknown override key: {k}")
+            mapped = _OVERRIDE_KEY_MAP.get(k)
+            if mapped is None:
+                logger.debug("Skipping unknown override key: %s", k)
                 continue
-            mapped = key_map[k]
             if isinstance(mapped, str):
-                logger.info(f"Setting {mapped} = {v}")
+                logger.info("Setting %s = %s", mapped, v)
                 merged[mapped] = v
             elif isinstance(mapped, tuple):
                 # Nested dicts
@@ -415,50 +634,11 @@ class DistroXRequestTemplateGenerator:
                     if key not in d or not isinstance(d[key], dict):
                         d[key] = {}
                     d = d[key]
-                logger.info(f"Setting nested {mapped} = {v}")
+                logger.info("Setting nested %s = %s", mapped, v)
                 d[mapped[-1]] = v
         
         return merged
     
-    def _parse_instance_groups_string(self, instance_groups_str: str) -> Dict[str, Dict[str, Any]]:
-        """
-        Parse instance groups string from CLI command.
-        
-        Args:
-            instance_groups_str (str): Space-separated string of instance group configurations from CLI
-            
-        Returns:
-            Dict[str, Dict[str, Any]]: Dictionary mapping group names to their configurations
-        """
-        instance_groups = {}
-        
-        logger.debug(f"Parsing instance groups string: {instance_groups_str}")
-        
-        group_definitions = instance_groups_str.split(' ')
-        logger.debug(f"Found {len(group_definitions)} group definitions")
-        
-        for i, group_def in enumerate(group_definitions):
-            if not group_def.strip():
-                continue
-                
-            logger.debug(f"Processing group definition {i+1}: {group_def}")
-            
-            group_config = {}
-            pairs = group_def.split(',')
-            
-            for pair in pairs:
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    group_config[key] = value
-                    logger.debug(f"  Parsed: {key} = {value}")
-            
-            group_name = group_config.get('instanceGroupName', 'unknown')
-            instance_groups[group_name] = group_config
-            logger.debug(f"Added instance group '{group_name}' with config: {group_config}")
-        
-        logger.info(f"Successfully parsed {len(instance_groups)} instance groups from CLI command")
-        return instance_groups
-    
     def extract_instance_group_details(self, group: Dict[str, Any], skip_cli_overrides: bool = False) -> Dict[str, Any]:
         """
         Extract and format instance group details.
@@ -470,20 +650,30 @@ class DistroXRequestTemplateGenerator:
         Returns:
             Dict[str, Any]: Formatted instance group configuration for request template
         """
-        instances = group.get("instances", [])
+        # name and instanceVmType are present in describe-cluster output almost
+        # always, so index directly and only fall back on a miss
+        try:
+            group_name = group["name"]
+        except KeyError:
+            group_name = "default"
+        
+        instances = group.get("instances", ())
         first_instance = instances[0] if instances else {}
         
-        instance_type = first_instance.get("instanceVmType", "m6i.4xlarge")
-        attached_volumes = []
+        try:
+            instance_type = first_instance["instanceVmType"]
+        except KeyError:
+            instance_type = "m6i.4xlarge"
         
-        raw_volumes = first_instance.get("attachedVolumes", [])
+        raw_volumes = first_instance.get("attachedVolumes")
         if raw_volumes:
+            attached_volumes = []
+            volume_type_remap = _VOLUME_TYPE_REMAP
             for volume in raw_volumes:
-                volume_type = volume.get("volumeType", "gp3")
-                # Convert only gp2 volumes to gp3, keep ephemeral as is
-                if volume_type == "gp2":
-                    volume_type = "gp3"
-                    logger.info(f"Converted volume type from gp2 to gp3")
+                source_type = volume.get("volumeType", "gp3")
+                volume_type = volume_type_remap.get(source_type, source_type)
+                if volume_type != source_type:
+                    logger.info("Converted volume type from %s to %s", source_type, volume_type)
                 
                 attached_volumes.append({
                     "size": volume.get("size", 256),
@@ -497,37 +687,30 @@ class DistroXRequestTemplateGenerator:
                 "type": "gp3"
             }]
         
-        instance_group_type = "CORE"  # Default fallback
+        instance_group_type = None
 
-        if not skip_cli_overrides and self.cli_command_data and self.cli_command_data.get("instance_groups_override"):
-            group_name = group.get("name", "default")
-            cli_group_config = self.cli_command_data["instance_groups_override"].get(group_name, {})
-            logger.debug(f"Looking for group '{group_name}' in CLI command data: {cli_group_config}")
-            if cli_group_config.get("instanceGroupType"):
-                instance_group_type = cli_group_config["instanceGroupType"]
-                logger.info(f"Using instanceGroupType from CLI command: {instance_group_type} for group {group_name}")
+        override_group_types = self._override_group_types
+        if not skip_cli_overrides and override_group_types:
+            cli_group_type = override_group_types.get(group_name)
+            logger.debug("Looking for group '%s' in CLI command data: instanceGroupType=%s", group_name, cli_group_type)
+            if cli_group_type:
+                instance_group_type = cli_group_type
+                logger.info("Using instanceGroupType from CLI command: %s for group %s", instance_group_type, group_name)
             else:
-                logger.debug(f"No instanceGroupType found in CLI command for group {group_name}, using fallback logic")
-                instance_type_value = first_instance.get("instanceType")
-                if instance_type_value == "GATEWAY_PRIMARY":
-                    instance_group_type = "GATEWAY"
-                else:
-                    instance_group_type = "CORE"
+                logger.debug("No instanceGroupType found in CLI command for group %s, using fallback logic", group_name)
+        elif skip_cli_overrides:
+            logger.debug("Skipping CLI command data for instance group type due to explicit overrides")
         else:
-            if skip_cli_overrides:
-                logger.debug("Skipping CLI command data for instance group type due to explicit overrides")
-            else:
-                logger.debug("No CLI command data available, using fallback logic for instance group type")
-            instance_type_value = first_instance.get("instanceType")
-            if instance_type_value == "GATEWAY_PRIMARY":
-                instance_group_type = "GATEWAY"
-            else:
-                instance_group_type = "CORE"
+            logger.debug("No CLI command data available, using fallback logic for instance group type")
+
+        if instance_group_type is None:
+            # Fallback: derive the group type from the first instance, defaulting to CORE
+            instance_group_type = _INSTANCE_GROUP_TYPE_MAP.get(first_instance.get("instanceType"), "CORE")
 
-        logger.info(f"Final instance group type determined: {instance_group_type} for group {group.get('name', 'default')}")
+        logger.info("Final instance group type determined: %s for group %s", instance_group_type, group_name)
         
         return {
-            "name": group.get("name", "default"),
+            "name": group_name,
             "nodeCount": len(instances),
             "type": instance_group_type,
             "recoveryMode": "MANUAL",
@@ -554,6 +737,21 @@ class DistroXRequestTemplateGenerator:
             "subnetIds": group.get("subnetIds", [])
         }
     
+    def extract_instance_group_details_batch(self, groups: List[Dict[str, Any]],
+                                             skip_cli_overrides: bool = False) -> List[Dict[str, Any]]:
+        """
+        Extract and format the details of several instance groups.
+        
+        Args:
+            groups (List[Dict[str, Any]]): Raw instance group data from cluster description
+            skip_cli_overrides (bool): If True, skip applying CLI command overrides for instance group type
+            
+        Returns:
+            List[Dict[str, Any]]: Formatted instance group configurations, in input order
+        """
+        extract = self.extract_instance_group_details
+        return [extract(group, skip_cli_overrides) for group in groups]
+    
     def extract_image_details(self, image_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract image details from cluster data.
@@ -579,17 +777,31 @@ class DistroXRequestTemplateGenerator:
         Returns:
             Dict[str, Any]: Network configuration with subnetId and networkId fields
         """
-        subnet_ids = []
-        if self.cli_command_data and self.cli_command_data.get("subnet_id"):
-            subnet_ids = [self.cli_command_data["subnet_id"]]
-        else:
-            cluster_info = cluster_data.get("cluster", {})
-            for group in cluster_info.get("instanceGroups", []):
-                subnet_ids.extend(group.get("subnetIds", []))
-            subnet_ids = list(dict.fromkeys(subnet_ids))
+        cli_data = self.cli_command_data
+        if cli_data:
+            cli_subnet_id = cli_data.get("subnet_id")
+            if cli_subnet_id:
+                return {
+                    "subnetId": cli_subnet_id,
+                    "networkId": None
+                }
+        
+        # Only the first subnet is used, so stop at the first group that has one.
+        # A malformed instanceGroups value is treated as empty, as in
+        # generate_request_template
+        subnet_id = None
+        cluster_info = cluster_data.get("cluster") or {}
+        raw_groups = cluster_info.get("instanceGroups") or ()
+        if not isinstance(raw_groups, list):
+            raw_groups = ()
+        for group in raw_groups:
+            group_subnet_ids = group.get("subnetIds")
+            if group_subnet_ids:
+                subnet_id = group_subnet_ids[0]
+                break
         
         return {
-            "subnetId": subnet_ids[0] if subnet_ids else None,
+            "subnetId": subnet_id,
             "networkId": None
         }
     
@@ -617,6 +829,10 @@ class DistroXRequestTemplateGenerator:
         """
         Build tags combining CLI command tags with generated tags.
         
+        The last result is reused while the same cluster_info and CLI command
+        data objects are passed with the same cluster name. Each call returns
+        its own copy, since callers may modify the generated template.
+        
         Args:
             cluster_info (Dict[str, Any]): Cluster information from description
             cluster_name (str): Final cluster name to use in dhname tag
@@ -624,21 +840,29 @@ class DistroXRequestTemplateGenerator:
         Returns:
             Dict[str, Any]: Combined tags including generated and CLI command tags
         """
+        cli_data = self.cli_command_data
+        # Compared by identity; the cached entry keeps both objects alive so
+        # their ids cannot be reused by other dicts
+        last = self._last_tags
+        if (last is not None and last[0] is cluster_info and last[1] is cli_data
+                and last[2] == cluster_name):
+            return dict(last[3])
+        
         user_defined_tags = {
             "generated-date": self.timestamp,
             "source-cluster": cluster_info.get("clusterName", "unknown"),
             "dhname": cluster_name
         }
         
-        if self.cli_command_data and self.cli_command_data.get("tags"):
-            logger.debug(f"CLI command tags found: {self.cli_command_data['tags']}")
-            for key, value in self.cli_command_data["tags"].items():
-                user_defined_tags[key] = value
-                logger.debug(f"Added CLI tag to template: {key} = {value}")
+        cli_tags = cli_data.get("tags") if cli_data else None
+        if cli_tags:
+            logger.debug("Adding CLI command tags to template: %s", cli_tags)
+            user_defined_tags.update(cli_tags)
         else:
             logger.debug("No CLI command tags found")
         
-        return user_defined_tags
+        self._last_tags = (cluster_info, cli_data, cluster_name, user_defined_tags)
+        return dict(user_defined_tags)
     
     def _get_load_balancer_setting(self, cluster_info: Dict[str, Any]) -> bool:
         """
@@ -650,8 +874,9 @@ class DistroXRequestTemplateGenerator:
         Returns:
             bool: Load balancer setting from CLI command or False as default
         """
-        if self.cli_command_data and "enable_load_balancer" in self.cli_command_data:
-            return self.cli_command_data["enable_load_balancer"]
+        cli_data = self.cli_command_data
+        if cli_data and "enable_load_balancer" in cli_data:
+            return cli_data["enable_load_balancer"]
         return False
     
     def _get_multi_az_setting(self, cluster_info: Dict[str, Any]) -> bool:
@@ -664,8 +889,9 @@ class DistroXRequestTemplateGenerator:
         Returns:
             bool: Multi-AZ setting from CLI command or cluster data, defaulting to False
         """
-        if self.cli_command_data and "multi_az" in self.cli_command_data:
-            return self.cli_command_data["multi_az"]
+        cli_data = self.cli_command_data
+        if cli_data and "multi_az" in cli_data:
+            return cli_data["multi_az"]
         return cluster_info.get("multiAz", False)
     
     def generate_request_template(self, cluster_data: Dict[str, Any], 
@@ -697,12 +923,26 @@ class DistroXRequestTemplateGenerator:
             
         Returns:
             Dict[str, Any]: Complete DistroX request template in JSON format
+            
+        Raises:
+            ValueError: If cluster_data has no cluster description and no cluster and
+                environment names were given to build the template from
         """
         
-        cluster_info = cluster_data.get("cluster", {})
+        cluster_info = cluster_data.get("cluster") or {}
+        if not cluster_info and not ((dh_name or cluster_name) and environment_name):
+            raise ValueError("Cluster data contains no cluster description; "
+                             "cannot generate a template without a cluster and environment name")
+        raw_groups = cluster_info.get("instanceGroups") or []
+        if not isinstance(raw_groups, list):
+            logger.warning("Ignoring instanceGroups: expected a list, got %s", type(raw_groups).__name__)
+            raw_groups = ()
+        raw_image_details = cluster_info.get("imageDetails")
         # Priority: dh_name > cluster_name > original cluster.clusterName > fallback
         final_cluster_name = dh_name or cluster_name or cluster_info.get("clusterName", "generated-cluster")
         final_environment_name = environment_name or cluster_info.get("environmentName", "default-environment")
+        enable_load_balancer = self._get_load_balancer_setting(cluster_info)
+        enable_multi_az = self._get_multi_az_setting(cluster_info)
         
         # Get bucket name
         final_bucket_name = bucket_name
@@ -712,57 +952,56 @@ class DistroXRequestTemplateGenerator:
             if not final_bucket_name:
                 final_bucket_name = "customer-bucket-name"
         
-        instance_groups = []
-        skip_cli_overrides = bool(instance_groups_override)
-        for group in cluster_info.get("instanceGroups", []):
-            instance_groups.append(self.extract_instance_group_details(group, skip_cli_overrides=skip_cli_overrides))
-        
-        # Determine subnet IDs to use
-        final_subnet_ids = []
+        # Determine subnet IDs to use; None means take them from the first
+        # instance group below
+        final_subnet_ids = None
         if subnet_ids:
             final_subnet_ids = subnet_ids
-            logger.info(f"Using subnet IDs from --subnet-ids: {final_subnet_ids}")
+            logger.info("Using subnet IDs from --subnet-ids: %s", final_subnet_ids)
         elif subnet_id:
             final_subnet_ids = [subnet_id]
-            logger.info(f"Using single subnet ID from --subnet-id: {final_subnet_ids}")
-        else:
-            # Use original subnet IDs from the first instance group as fallback
-            if instance_groups:
-                final_subnet_ids = instance_groups[0].get("subnetIds", [])
-                logger.info(f"Using original subnet IDs from template: {final_subnet_ids}")
+            logger.info("Using single subnet ID from --subnet-id: %s", final_subnet_ids)
         
-        # Apply subnet IDs to all instance groups
-        if final_subnet_ids:
-            for group in instance_groups:
+        # Group the instance group overrides by the instanceGroupName they target
+        overrides_by_name = {}
+        for override in instance_groups_override or ():
+            if "instanceGroupName" in override:
+                overrides_by_name.setdefault(override["instanceGroupName"], []).append(override)
+            else:
+                logger.warning("Instance group override provided without instanceGroupName - skipping")
+        
+        # Extract all instance groups, then apply the subnet IDs and merge
+        # each group's overrides in a single pass
+        instance_groups = self.extract_instance_group_details_batch(
+            raw_groups, skip_cli_overrides=bool(instance_groups_override))
+        for i, group in enumerate(instance_groups):
+            if final_subnet_ids is None:
+                # Use original subnet IDs from the first instance group as fallback
+                final_subnet_ids = group.get("subnetIds", [])
+                logger.info("Using original subnet IDs from template: %s", final_subnet_ids)
+            if final_subnet_ids:
                 group["subnetIds"] = final_subnet_ids
-            logger.info(f"Applied subnet IDs to all instance groups: {final_subnet_ids}")
-        
-        # Apply instance groups overrides if provided
-        if instance_groups_override:
-            for override in instance_groups_override:
-                # Only override groups that match the instanceGroupName
-                if "instanceGroupName" in override:
-                    target_name = override["instanceGroupName"]
-                    # Find and override only the matching group
-                    for i, group in enumerate(instance_groups):
-                        if group.get("name") == target_name:
-                            logger.info(f"Overriding instance group '{target_name}' with CLI arguments")
-                            merged = self.merge_instance_group_override(group, override)
-                            instance_groups[i] = merged
-                            break
-                    else:
-                        logger.warning(f"No instance group found with name '{target_name}' to override")
-                else:
-                    logger.warning("Instance group override provided without instanceGroupName - skipping")
+            
+            # Only the first group with a matching name is overridden
+            for override in overrides_by_name.pop(group.get("name"), ()):
+                logger.info("Overriding instance group '%s' with CLI arguments", override["instanceGroupName"])
+                group = self.merge_instance_group_override(group, override)
+                instance_groups[i] = group
+        
+        if final_subnet_ids:
+            logger.info("Applied subnet IDs to all instance groups: %s", final_subnet_ids)
+        for target_name in overrides_by_name:
+            logger.warning("No instance group found with name '%s' to override", target_name)
         
         image_details = None
-        if "imageDetails" in cluster_info:
-            image_details = self.extract_image_details(cluster_info["imageDetails"])
+        if raw_image_details is not None:
+            image_details = self.extract_image_details(raw_image_details)
         
         network_details = self.extract_network_details(cluster_data)
         
         cluster_details = self.extract_cluster_details(cluster_data)
         
+        s3_names = {"b": final_bucket_name, "c": final_cluster_name}
         request_template = {
             "environmentName": final_environment_name,
             "name": final_cluster_name,
@@ -773,49 +1012,42 @@ class DistroXRequestTemplateGenerator:
                 "databases": [],
                 "cloudStorage": {
                     "locations": [
-                        {
-                            "type": "YARN_LOG",
-                            "value": f"s3a://{final_bucket_name}/datalake/oplogs/yarn-app-logs"
-                        },
-                        {
-                            "type": "ZEPPELIN_NOTEBOOK",
-                            "value": f"s3a://{final_bucket_name}/datalake/{final_cluster_name}/zeppelin/notebook"
-                        }
+                        {"type": location_type, "value": path.format_map(s3_names)}
+                        for location_type, path in _S3_LOCATIONS
                     ]
                 },
-                "exposedServices": ["ALL"],
+                "exposedServices": list(_EXPOSED_SERVICES),
                 "blueprintName": blueprint_name or cluster_info.get("workloadType", "<unknown>"),
                 "validateBlueprint": False
             },
-            "externalDatabase": {
-                "availabilityType": "HA"
-            },
+            "externalDatabase": dict(_EXTERNAL_DATABASE),
             "tags": {
                 "application": None,
                 "userDefined": self._build_tags(cluster_info, final_cluster_name),
                 "defaults": None
             },
             "inputs": {
-                "ynlogd.dirs": "/hadoopfs/fs1/nodemanager/log,/hadoopfs/fs2/nodemanager/log",
-                "ynld.dirs": "/hadoopfs/fs1/nodemanager,/hadoopfs/fs2/nodemanager",
-                "dfs.dirs": "/hadoopfs/fs3/datanode,/hadoopfs/fs4/datanode",
-                "query_data_hive_path": f"s3a://{final_bucket_name}/warehouse/tablespace/external/{final_cluster_name}/hive/sys.db/query_data",
-                "query_data_tez_path": f"s3a://{final_bucket_name}/warehouse/tablespace/external/{final_cluster_name}/hive/sys.db"
+                **_STATIC_INPUTS,
+                **{key: path.format_map(s3_names) for key, path in _S3_QUERY_DATA_INPUTS}
             },
             "gatewayPort": None,
-            "enableLoadBalancer": self._get_load_balancer_setting(cluster_info),
+            "enableLoadBalancer": enable_load_balancer,
             "variant": "CDP",
             "javaVersion": java_version,
-            "enableMultiAz": self._get_multi_az_setting(cluster_info),
+            "enableMultiAz": enable_multi_az,
             "architecture": "x86_64",
             "disableDbSslEnforcement": False,
             "security": cluster_info.get("security", {})
         }
+        # Leave the image out entirely when the cluster has no image details;
+        # a missing image gets the same default as a null one
+        if image_details is None:
+            del request_template["image"]
         
         return request_template
     
     def save_template(self, template: Dict[str, Any], output_dir: str, 
-                     cluster_name: str, source_type: str) -> str:
+                     cluster_name: str, source_type: str, compact: bool = False) -> str:
         """
         Save the generated template to a file.
         
@@ -824,31 +1056,56 @@ class DistroXRequestTemplateGenerator:
             output_dir (str): Directory where the template file should be saved
             cluster_name (str): Name of the cluster (used in filename)
             source_type (str): Type of source (e.g., "running-cluster", "json-file")
+            compact (bool): If True, write the JSON without indentation or spaces
             
         Returns:
             str: Full path to the saved template file
         """
         
-        timestamped_dir = Path(output_dir) / f"request-template-{self.timestamp}"
-        timestamped_dir.mkdir(parents=True, exist_ok=True)
+        _, dir_name, file_suffix = self._get_timestamp_names()
+        # The timestamped directory is resolved and created once per output_dir
+        timestamped_dir = self._output_dirs.get(output_dir)
+        if timestamped_dir is None:
+            timestamped_dir = Path(output_dir) / dir_name
+            timestamped_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dirs[output_dir] = timestamped_dir
         
-        filename = f"{cluster_name}_{source_type}_template_{self.timestamp}.json"
+        filename = f"{cluster_name}_{source_type}{file_suffix}"
         filepath = timestamped_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(template, f, indent=2)
+        # Write to a temporary file and rename it into place so readers never
+        # see a partially written template
+        tmp_filepath = filepath.with_name(filename + ".tmp")
+        try:
+            if orjson is not None:
+                option = 0 if compact else orjson.OPT_INDENT_2
+                with open(tmp_filepath, 'wb') as f:
+                    f.write(orjson.dumps(template, option=option))
+            else:
+                # Stream the encoder chunks through a large write buffer rather
+                # than building the whole indented string in memory
+                with open(tmp_filepath, 'w', buffering=1 << 20) as f:
+                    if compact:
+                        json.dump(template, f, separators=(",", ":"))
+                    else:
+                        json.dump(template, f, indent=2)
+            os.replace(tmp_filepath, filepath)
+        except Exception:
+            if tmp_filepath.exists():
+                tmp_filepath.unlink()
+            raise
         
         logger.info(f"Template saved to: {filepath}")
         return str(filepath)
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
     """
-    Main function to handle command line arguments and execute template generation.
+    Build the command line argument parser, once per process.
     
-    Processes command line arguments, loads cluster data, generates request template,
-    and saves the result to a timestamped file in the specified output directory.
+    Returns:
+        argparse.ArgumentParser: Parser for the generate_request_template.py arguments
     """
-    
     parser = argparse.ArgumentParser(
         description="Generate DistroX request templates from running clusters or JSON files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -952,7 +1209,23 @@ Examples:
         help="Override the blueprint name in the template (default: uses workloadType from cluster data)"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the template as compact JSON without indentation (default: indented)"
+    )
+    
+    return parser
+
+def main():
+    """
+    Main function to handle command line arguments and execute template generation.
+    
+    Processes command line arguments, loads cluster data, generates request template,
+    and saves the result to a timestamped file in the specified output directory.
+    """
+    
+    args = _get_parser().parse_args()
     
     generator = DistroXRequestTemplateGenerator()
     
@@ -961,9 +1234,9 @@ Examples:
             cli_data = generator.parse_cli_command_file(args.cli_command_file)
             generator.cli_command_data = cli_data
             logger.info(f"Loaded CLI command data from: {args.cli_command_file}")
-            logger.info(f"Parsed CLI data: {cli_data}")
+            logger.info("Parsed CLI data: %s", cli_data)
             if cli_data.get("tags"):
-                logger.info(f"Found tags in CLI command: {cli_data['tags']}")
+                logger.info("Found tags in CLI command: %s", cli_data['tags'])
             else:
                 logger.warning("No tags found in CLI command data")
         except Exception as e:
@@ -974,10 +1247,8 @@ Examples:
     instance_groups_override = None
     if args.instance_groups:
         try:
-            # Join all instance group strings into one string for parsing
-            instance_groups_str = " ".join(args.instance_groups)
-            instance_groups_override = generator.parse_instance_groups_argument(instance_groups_str)
-            logger.info(f"Parsed instance groups override: {instance_groups_override}")
+            instance_groups_override = generator.parse_instance_groups_argument(args.instance_groups)
+            logger.info("Parsed instance groups override: %s", instance_groups_override)
         except Exception as e:
             logger.error(f"Failed to parse instance groups argument: {e}")
             sys.exit(1)
@@ -1016,16 +1287,19 @@ Examples:
             blueprint_name=args.blueprint_name
         )
         
-        output_path = generator.save_template(template, output_dir, cluster_name, source_type)
+        output_path = generator.save_template(template, output_dir, cluster_name, source_type,
+                                                compact=args.compact)
         
         logger.info("Template generation completed successfully!")
         logger.info(f"Output file: {output_path}")
         
-        print(f"\n=== Template Generation Summary ===")
-        print(f"Source: {source_type}")
-        print(f"Cluster: {cluster_name}")
-        print(f"Output: {output_path}")
-        print(f"Timestamp: {generator.timestamp}")
+        sys.stdout.write(
+            f"\n=== Template Generation Summary ===\n"
+            f"Source: {source_type}\n"
+            f"Cluster: {cluster_name}\n"
+            f"Output: {output_path}\n"
+            f"Timestamp: {generator.timestamp}\n"
+        )
         
     except Exception as e:
         logger.error(f"Template generation failed: {e}")
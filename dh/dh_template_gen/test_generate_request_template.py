@@ -0,0 +1,30 @@
+"""Tests for the --instance-groups argument parsing of generate_request_template.py"""
+
+import unittest
+
+from generate_request_template import DistroXRequestTemplateGenerator
+
+WORKER = "nodeCount=5,instanceGroupName=worker"
+MASTER = "nodeCount=7,instanceGroupName=master"
+EXPECTED = [
+    {"nodeCount": 5, "instanceGroupName": "worker"},
+    {"nodeCount": 7, "instanceGroupName": "master"},
+]
+
+
+class ParseInstanceGroupsArgumentTest(unittest.TestCase):
+    def setUp(self):
+        self.generator = DistroXRequestTemplateGenerator()
+
+    def test_single_string(self):
+        # -i "nodeCount=5,... nodeCount=7,..." and CLI command file values
+        self.assertEqual(self.generator.parse_instance_groups_argument([f"{WORKER} {MASTER}"]), EXPECTED)
+        self.assertEqual(self.generator.parse_instance_groups_argument(f"{WORKER} {MASTER}"), EXPECTED)
+
+    def test_multiple_arguments(self):
+        # -i "nodeCount=5,..." "nodeCount=7,..."
+        self.assertEqual(self.generator.parse_instance_groups_argument([WORKER, MASTER]), EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
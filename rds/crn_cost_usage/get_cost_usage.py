@@ -23,13 +23,304 @@ Features:
 
 import argparse
 import boto3
+import botocore.config
+import hashlib
 import json
+import logging
+import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
+logger = logging.getLogger(__name__)
+
+# CloudWatch statistics collected for every RDS metric
+METRIC_STATISTICS = ('Average', 'Maximum', 'Minimum')
+
+# Cost Explorer cost metrics and the keys they are stored under in the analysis
+METRIC_KEYS = {
+    'BlendedCost': 'blended',
+    'UnblendedCost': 'unblended',
+    'AmortizedCost': 'amortized',
+    'NetUnblendedCost': 'net_unblended',
+    'NetAmortizedCost': 'net_amortized'
+}
+COST_METRICS = list(METRIC_KEYS)
+
+# Report descriptions of the cost metrics
+COST_DESCRIPTIONS = {
+    'BlendedCost': 'Average cost across consolidated billing family',
+    'UnblendedCost': 'Actual cost on the day it was charged (cash basis)',
+    'AmortizedCost': 'Cost spread across billing period (accrual basis)',
+    'NetUnblendedCost': 'Unblended cost after discounts',
+    'NetAmortizedCost': 'Amortized cost after discounts'
+}
+
+# Cost windows longer than this many days are requested per month instead of per day
+MONTHLY_GRANULARITY_MIN_DAYS = 90
+
+# Tag identifying the Cloudera resource an RDS instance belongs to
+CLOUDERA_TAG_KEY = 'Cloudera-Resource-Name'
+
+# Cost Explorer SERVICE dimension value for RDS
+RDS_SERVICE = 'Amazon Relational Database Service'
+
+# Adaptive retries absorb CloudWatch and Cost Explorer throttling; the larger
+# pool lets concurrent requests on one client reuse connections, and bounded
+# timeouts keep a stalled connection from hanging the run
+_CLIENT_CONFIG = botocore.config.Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=30,
+    tcp_keepalive=True,
+    user_agent_extra='torazu-rds-cost/1.0'
+)
+
+_session = None
+_client_cache: Dict[Tuple[str, str], Any] = {}
+
+# On-disk cache of Cost Explorer results for windows old enough to be final
+CE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'torazu')
+CE_CACHE_MIN_AGE = timedelta(hours=48)
+
+
+def _client(service: str, region: str) -> Any:
+    """
+    Get a boto3 client for a service and region, creating it on first use.
+    
+    Clients are cached for the lifetime of the process and share one session, so
+    analyzers for the same region do not reload service models or open new
+    connection pools.
+    
+    Args:
+        service (str): AWS service name (e.g. 'cloudwatch', 'ce', 'rds')
+        region (str): AWS region
+        
+    Returns:
+        Any: boto3 client for the service
+    """
+    global _session
+    key = (service, region)
+    client = _client_cache.get(key)
+    if client is None:
+        if _session is None:
+            _session = boto3.session.Session()
+        client = _session.client(service, region_name=region, config=_CLIENT_CONFIG)
+        _client_cache[key] = client
+    return client
+
+
+def _ce_cache_path(request: Dict) -> Optional[str]:
+    """
+    Get the cache file for a Cost Explorer request, if its results can be cached.
+    
+    Only windows that ended at least CE_CACHE_MIN_AGE ago are cached, since Cost
+    Explorer keeps updating recent data. The key includes the credentials' access
+    key ID so different accounts never share cached costs.
+    
+    Args:
+        request (Dict): get_cost_and_usage keyword arguments (without NextPageToken)
+        
+    Returns:
+        Optional[str]: Cache file path, or None if the request must not be cached
+    """
+    end = datetime.strptime(request['TimePeriod']['End'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    if end > datetime.now(timezone.utc) - CE_CACHE_MIN_AGE:
+        return None
+    
+    credentials = _session.get_credentials() if _session is not None else None
+    access_key = getattr(credentials, 'access_key', None)
+    if access_key is None:
+        return None
+    
+    key = json.dumps([access_key, request], sort_keys=True)
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(CE_CACHE_DIR, f"ce-{digest}.json")
+
+
+def _cost_granularity(start_dt: datetime, end_dt: datetime) -> str:
+    """
+    Choose the Cost Explorer granularity for a window.
+    
+    Args:
+        start_dt (datetime): Window start
+        end_dt (datetime): Window end
+        
+    Returns:
+        str: 'MONTHLY' for windows longer than MONTHLY_GRANULARITY_MIN_DAYS, 'DAILY' otherwise
+    """
+    return 'MONTHLY' if (end_dt - start_dt).days > MONTHLY_GRANULARITY_MIN_DAYS else 'DAILY'
+
+
+def _to_dt(timestamp: Union[str, datetime]) -> datetime:
+    """
+    Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC.
+    
+    Args:
+        timestamp (Union[str, datetime]): Timestamp such as 2024-01-01T00:00:00Z;
+            datetime objects are returned unchanged
+        
+    Returns:
+        datetime: Timezone-aware datetime
+    """
+    if isinstance(timestamp, datetime):
+        return timestamp
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _render_grid(headers: List[str], rows: List[List[str]]) -> str:
+    """
+    Render pre-formatted string cells as a grid table.
+    
+    Produces the same layout as tabulate(..., headers="firstrow", tablefmt="grid")
+    for tables whose cells are already strings, in a single pass over the cells.
+    Columns whose cells are all digits (e.g. day counts) are right-aligned.
+    
+    Args:
+        headers (List[str]): Column headers
+        rows (List[List[str]]): Table rows of formatted cells
+        
+    Returns:
+        str: Rendered table
+    """
+    columns = list(zip(*rows)) if rows else [()] * len(headers)
+    # Headers get two characters of padding, as in tabulate
+    widths = [max(len(header) + 2, *map(len, column)) for header, column in zip(headers, columns)]
+    right_aligned = [bool(column) and all(cell.isdigit() for cell in column) for column in columns]
+    
+    def render_row(cells):
+        return "| " + " | ".join(
+            cell.rjust(width) if right else cell.ljust(width)
+            for cell, width, right in zip(cells, widths, right_aligned)
+        ) + " |"
+    
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    header_separator = "+" + "+".join("=" * (width + 2) for width in widths) + "+"
+    
+    lines = [separator, render_row(headers), header_separator]
+    for row in rows:
+        lines.append(render_row(row))
+        lines.append(separator)
+    return "\n".join(lines)
+
+
+def _write_csv(df: pd.DataFrame, filename: str, **to_csv_options) -> None:
+    """
+    Write a DataFrame to a CSV file through a single large write buffer.
+    
+    Args:
+        df (pd.DataFrame): Data to write
+        filename (str): Output CSV path
+        **to_csv_options: Options passed on to DataFrame.to_csv
+    """
+    # UTF-8 matches what to_csv uses when given a path
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        df.to_csv(f, **to_csv_options)
+
+
+def _group_cost_breakdown(cost_breakdown: Dict[Tuple[str, str], float]) -> Dict[str, Dict[str, float]]:
+    """
+    Group the flat (usage type, metric key) cost breakdown by usage type.
+    
+    Args:
+        cost_breakdown (Dict[Tuple[str, str], float]): Costs keyed by usage type and metric key
+        
+    Returns:
+        Dict[str, Dict[str, float]]: Costs per metric key for each usage type
+    """
+    usage_breakdown = defaultdict(dict)
+    for (usage_type, cost_type), cost in cost_breakdown.items():
+        usage_breakdown[usage_type][cost_type] = cost
+    return dict(usage_breakdown)
+
+
+def _collapse_tag_groups(results: List[Dict], tag_value: Optional[str]) -> List[Dict]:
+    """
+    Reduce Cost Explorer results grouped by Cloudera-Resource-Name tag and a
+    dimension to results grouped by the dimension alone.
+    
+    Only groups for the given tag value are kept; with no tag value the groups of
+    all tag values are merged. Each day also gets a 'Total' summed over the kept
+    groups, since Cost Explorer leaves it empty for grouped requests.
+    
+    Args:
+        results (List[Dict]): ResultsByTime grouped by [TAG, DIMENSION]
+        tag_value (Optional[str]): Cloudera-Resource-Name value to keep, or None for all
+        
+    Returns:
+        List[Dict]: ResultsByTime entries with one group per dimension value
+    """
+    tag_group_key = f"{CLOUDERA_TAG_KEY}${tag_value}" if tag_value else None
+    collapsed = []
+    
+    for result in results:
+        groups = {}
+        total = {}
+        for group in result.get('Groups', []):
+            tag_key, dimension = group['Keys']
+            if tag_group_key is not None and tag_key != tag_group_key:
+                continue
+            
+            merged = groups.setdefault(dimension, {})
+            for metric, value in group['Metrics'].items():
+                amount = float(value['Amount'])
+                for target in (merged, total):
+                    if metric in target:
+                        target[metric]['Amount'] += amount
+                    else:
+                        target[metric] = {'Amount': amount, 'Unit': value.get('Unit')}
+        
+        collapsed.append({
+            'TimePeriod': result['TimePeriod'],
+            'Total': total,
+            'Groups': [{'Keys': [dimension], 'Metrics': metrics} for dimension, metrics in groups.items()],
+            'Estimated': result.get('Estimated', False)
+        })
+    
+    return collapsed
+
+
+def _has_tag_groups(results: List[Dict], tag_value: str) -> bool:
+    """
+    Check whether any TAG-grouped result has costs for the given tag value.
+    
+    Args:
+        results (List[Dict]): ResultsByTime grouped by [TAG, DIMENSION]
+        tag_value (str): Cloudera-Resource-Name value to look for
+        
+    Returns:
+        bool: True if at least one group belongs to the tag value
+    """
+    tag_group_key = f"{CLOUDERA_TAG_KEY}${tag_value}"
+    return any(
+        group['Keys'][0] == tag_group_key
+        for result in results
+        for group in result.get('Groups', [])
+    )
+
+
+def _rds_general_costs(rds_detailed_costs: List[Dict]) -> List[Dict]:
+    """
+    Build the per-day general RDS costs from the per-usage-type costs.
+    
+    Args:
+        rds_detailed_costs (List[Dict]): ResultsByTime grouped by usage type, with per-day totals
+        
+    Returns:
+        List[Dict]: ResultsByTime with a single RDS service group per day that has costs
+    """
+    return [
+        {**result, 'Groups': [{'Keys': [RDS_SERVICE], 'Metrics': result['Total']}]}
+        for result in rds_detailed_costs
+        if result['Groups']
+    ]
+
 
 class RDSAnalyzer:
     """
@@ -41,37 +332,44 @@ class RDSAnalyzer:
     daily and monthly cost breakdowns.
     """
     
-    def __init__(self, region: str):
+    def __init__(self, region: str, use_cache: bool = False):
         """
         Initialize the analyzer with AWS clients.
         
         Args:
             region (str): AWS region for the analysis
+            use_cache (bool): If True, reuse Cost Explorer results cached on disk for
+                windows that ended more than 48 hours ago
         """
         self.region = region
-        self.cloudwatch = boto3.client('cloudwatch', region_name=region)
-        self.cost_explorer = boto3.client('ce', region_name=region)
-        self.rds = boto3.client('rds', region_name=region)
+        self.use_cache = use_cache
+        self.cloudwatch = _client('cloudwatch', region)
+        self.cost_explorer = _client('ce', region)
+        self.rds = _client('rds', region)
+        # Instance info per DB instance identifier, so repeated lookups within
+        # one session do not call DescribeDBInstances again
+        self._instance_info_cache: Dict[str, Dict] = {}
         
-    def get_rds_metrics(self, db_instance_id: str, start_time: str, end_time: str) -> Dict:
+    def get_rds_metrics(self, db_instance_id: str, start_time: Union[str, datetime],
+                        end_time: Union[str, datetime]) -> Dict:
         """
         Collect RDS performance metrics from CloudWatch.
         
         Args:
             db_instance_id (str): RDS DB Instance Identifier
-            start_time (str): Start time in ISO format
-            end_time (str): End time in ISO format
+            start_time (Union[str, datetime]): Start time as a datetime or in ISO format
+            end_time (Union[str, datetime]): End time as a datetime or in ISO format
             
         Returns:
             Dict: Dictionary containing metrics data with datapoints for each metric
         """
-        print(f"Collecting performance metrics for {db_instance_id}...")
+        # Logged rather than printed: main runs this on a worker thread, and
+        # logging keeps its lines whole and off the report on stdout
+        logger.info("Collecting performance metrics for %s...", db_instance_id)
         
-        # Parse datetime strings
-        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-        
-        metrics = {}
+        # Parse datetime strings (datetimes are used as-is)
+        start_dt = _to_dt(start_time)
+        end_dt = _to_dt(end_time)
         
         # Define key RDS metrics to collect
         metric_queries = {
@@ -117,6 +415,98 @@ class RDSAnalyzer:
             }
         }
         
+        try:
+            metrics = self._get_metric_data_batch(metric_queries, start_dt, end_dt)
+        except Exception as e:
+            # GetMetricData may not be allowed where only GetMetricStatistics is
+            logger.warning("Batch metric query failed (%s), collecting metrics one by one...", e)
+            metrics = self._get_metric_statistics_each(metric_queries, start_dt, end_dt)
+        
+        return metrics
+    
+    def _get_metric_data_batch(self, metric_queries: Dict, start_dt: datetime, end_dt: datetime) -> Dict:
+        """
+        Collect all metrics with paginated GetMetricData calls instead of one call per metric.
+        
+        Each metric is queried once per statistic and the series are merged back into
+        GetMetricStatistics-style datapoints keyed by timestamp.
+        
+        Args:
+            metric_queries (Dict): Metric name to CloudWatch metric definition
+            start_dt (datetime): Start of the period
+            end_dt (datetime): End of the period
+            
+        Returns:
+            Dict: Dictionary containing metrics data with datapoints for each metric
+        """
+        queries = []
+        query_targets = {}
+        for i, (metric_name, metric_config) in enumerate(metric_queries.items()):
+            for stat in METRIC_STATISTICS:
+                query_id = f"m{i}_{stat[:3].lower()}"
+                query_targets[query_id] = (metric_name, stat)
+                queries.append({
+                    'Id': query_id,
+                    'MetricStat': {
+                        'Metric': metric_config,
+                        'Period': 3600,  # 1 hour periods
+                        'Stat': stat
+                    },
+                    'ReturnData': True
+                })
+        
+        datapoints = {metric_name: {} for metric_name in metric_queries}
+        failures = {}
+        kwargs = {
+            'MetricDataQueries': queries,
+            'StartTime': start_dt,
+            'EndTime': end_dt,
+            'ScanBy': 'TimestampAscending'
+        }
+        while True:
+            response = self.cloudwatch.get_metric_data(**kwargs)
+            for result in response['MetricDataResults']:
+                metric_name, stat = query_targets[result['Id']]
+                if result.get('StatusCode') not in ('Complete', 'PartialData'):
+                    failures[metric_name] = result.get('StatusCode')
+                    continue
+                by_timestamp = datapoints[metric_name]
+                for timestamp, value in zip(result['Timestamps'], result['Values']):
+                    datapoint = by_timestamp.get(timestamp)
+                    if datapoint is None:
+                        datapoint = by_timestamp[timestamp] = {'Timestamp': timestamp}
+                    datapoint[stat] = value
+            
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+            kwargs['NextToken'] = next_token
+        
+        metrics = {}
+        for metric_name, by_timestamp in datapoints.items():
+            if metric_name in failures:
+                logger.warning("✗ Failed to collect %s: %s", metric_name, failures[metric_name])
+                metrics[metric_name] = []
+                continue
+            metrics[metric_name] = list(by_timestamp.values())
+            logger.info("✓ Collected %s: %d data points", metric_name, len(by_timestamp))
+        
+        return metrics
+    
+    def _get_metric_statistics_each(self, metric_queries: Dict, start_dt: datetime, end_dt: datetime) -> Dict:
+        """
+        Collect metrics with one GetMetricStatistics call per metric.
+        
+        Args:
+            metric_queries (Dict): Metric name to CloudWatch metric definition
+            start_dt (datetime): Start of the period
+            end_dt (datetime): End of the period
+            
+        Returns:
+            Dict: Dictionary containing metrics data with datapoints for each metric
+        """
+        metrics = {}
+        
         for metric_name, metric_config in metric_queries.items():
             try:
                 response = self.cloudwatch.get_metric_statistics(
@@ -126,48 +516,193 @@ class RDSAnalyzer:
                     StartTime=start_dt,
                     EndTime=end_dt,
                     Period=3600,  # 1 hour periods
-                    Statistics=['Average', 'Maximum', 'Minimum']
+                    Statistics=list(METRIC_STATISTICS)
                 )
                 
                 metrics[metric_name] = response['Datapoints']
-                print(f"  ✓ Collected {metric_name}: {len(response['Datapoints'])} data points")
+                logger.info("✓ Collected %s: %d data points", metric_name, len(response['Datapoints']))
                 
             except Exception as e:
-                print(f"  ✗ Failed to collect {metric_name}: {str(e)}")
+                logger.warning("✗ Failed to collect %s: %s", metric_name, e)
                 metrics[metric_name] = []
         
         return metrics
     
-    def get_cost_data(self, db_instance_id: str, start_time: str, end_time: str, cloudera_resource_name: str = None) -> Dict:
+    def get_cost_data(self, db_instance_id: str, start_time: Union[str, datetime], end_time: Union[str, datetime],
+                      cloudera_resource_name: str = None,
+                      allow_broader_range: bool = False, granularity: Optional[str] = None) -> Dict:
         """
         Collect cost data using Cost Explorer API with proper filters.
         
+        Costs are requested grouped by the Cloudera-Resource-Name tag and filtered
+        by tag value client-side, so the same requests serve the untagged fallback.
+        
         Args:
             db_instance_id (str): RDS DB Instance Identifier
-            start_time (str): Start time in ISO format
-            end_time (str): End time in ISO format
+            start_time (Union[str, datetime]): Start time as a datetime or in ISO format
+            end_time (Union[str, datetime]): End time as a datetime or in ISO format
             cloudera_resource_name (str, optional): Cloudera-Resource-Name tag value for filtering
+            allow_broader_range (bool): If True and no data is found, retry with the previous 30 days included
+            granularity (str, optional): 'DAILY' or 'MONTHLY'; chosen from the window length if not given
             
         Returns:
-            Dict: Dictionary containing general costs and detailed RDS costs
+            Dict: Dictionary containing general costs, detailed RDS costs and their granularity
         """
-        print(f"Collecting cost data for {db_instance_id}...")
+        logger.info("Collecting cost data for %s...", db_instance_id)
         
         # Parse datetime strings and convert to yyyy-MM-dd format for Cost Explorer
-        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+        start_dt = _to_dt(start_time)
+        end_dt = _to_dt(end_time)
         
         # Cost Explorer expects yyyy-MM-dd format
         start_date = start_dt.strftime('%Y-%m-%d')
         end_date = end_dt.strftime('%Y-%m-%d')
         
+        # Long windows are requested per month to keep the number of result rows down
+        granularity = granularity or _cost_granularity(start_dt, end_dt)
+        
         # Build filter for Cost Explorer
+        cost_filter = self._rds_cost_filter()
+        
+        if cloudera_resource_name:
+            logger.info("Using Cloudera-Resource-Name filter: %s", cloudera_resource_name)
+        else:
+            logger.warning("No Cloudera-Resource-Name tag found, using general RDS filter")
+        
+        try:
+            rds_detailed_costs = self._get_rds_detailed_costs(
+                start_date, end_date, cost_filter, cloudera_resource_name, granularity)
+            general_costs = _rds_general_costs(rds_detailed_costs)
+            
+            if not general_costs and not allow_broader_range:
+                logger.warning("No data found for specified period (use --allow-broader-range to also search the previous 30 days)")
+            
+            # If still no data and allowed, try a broader date range (last 30 days)
+            if not general_costs and allow_broader_range:
+                logger.info("No data found for specified period, trying last 30 days...")
+                broader_start = (start_dt - timedelta(days=30)).strftime('%Y-%m-%d')
+                
+                # Same RDS filter and tag handling, only over the wider window
+                rds_detailed_costs = self._get_rds_detailed_costs(
+                    broader_start, end_date, cost_filter, cloudera_resource_name, granularity)
+                general_costs = _rds_general_costs(rds_detailed_costs)
+                
+                if general_costs:
+                    logger.info("Found data in broader date range: %s to %s", broader_start, end_date)
+            
+            logger.info("✓ Collected cost data: %d days", len(general_costs))
+            
+            # Debug: Log sample response structure
+            if general_costs and logger.isEnabledFor(logging.DEBUG):
+                sample_result = general_costs[0]
+                logger.debug("Debug: Sample cost result structure: %s", list(sample_result.keys()))
+                if 'Total' in sample_result:
+                    logger.debug("Debug: Total metrics available: %s", list(sample_result['Total'].keys()))
+            
+            return {
+                'general_costs': general_costs,
+                'rds_detailed_costs': rds_detailed_costs,
+                'granularity': granularity
+            }
+            
+        except Exception as e:
+            logger.error("✗ Failed to collect cost data: %s", e)
+            return {'general_costs': [], 'rds_detailed_costs': [], 'granularity': granularity}
+    
+    def _get_rds_detailed_costs(self, start_date: str, end_date: str, cost_filter: Dict,
+                                cloudera_resource_name: Optional[str], granularity: str) -> List[Dict]:
+        """
+        Get the RDS costs per usage type of one Cloudera resource.
+        
+        The filter restricts the costs to RDS, so the general costs are their
+        per-period totals. If the tag value has no costs, all RDS costs in the
+        region are used instead.
+        
+        Args:
+            start_date (str): Start date (yyyy-MM-dd)
+            end_date (str): End date (yyyy-MM-dd, exclusive)
+            cost_filter (Dict): Cost Explorer filter expression
+            cloudera_resource_name (str, optional): Cloudera-Resource-Name tag value
+            granularity (str): Cost Explorer granularity ('DAILY' or 'MONTHLY')
+            
+        Returns:
+            List[Dict]: ResultsByTime entries grouped by usage type only
+        """
+        response = self._get_cost_and_usage(
+            start_date, end_date, 'USAGE_TYPE', COST_METRICS, cost_filter, tag_key=CLOUDERA_TAG_KEY,
+            granularity=granularity)
+        
+        # If no data with tag filter, fall back to all RDS costs in the region
+        tag_value = cloudera_resource_name
+        if tag_value and not _has_tag_groups(response['ResultsByTime'], tag_value):
+            logger.info("No data found with tag filter, using costs without tag filter...")
+            tag_value = None
+        
+        return _collapse_tag_groups(response['ResultsByTime'], tag_value)
+    
+    def get_cost_data_batch(self, cloudera_resource_names: List[str], start_time: Union[str, datetime],
+                            end_time: Union[str, datetime], granularity: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Collect cost data for several Cloudera resources with a single Cost Explorer request.
+        
+        Costs are grouped by the Cloudera-Resource-Name tag and usage type and split
+        per tag value client-side, so analyzing N instances costs one request
+        instead of N. Unlike get_cost_data there is no fallback to untagged RDS
+        costs: a tag value without costs gets empty cost data.
+        
+        Args:
+            cloudera_resource_names (List[str]): Cloudera-Resource-Name tag values to collect costs for
+            start_time (Union[str, datetime]): Start time as a datetime or in ISO format
+            end_time (Union[str, datetime]): End time as a datetime or in ISO format
+            granularity (str, optional): 'DAILY' or 'MONTHLY'; chosen from the window length if not given
+            
+        Returns:
+            Dict[str, Dict]: Cost data per tag value, each in the format returned by get_cost_data
+        """
+        logger.info("Collecting cost data for %d Cloudera resources...", len(cloudera_resource_names))
+        
+        start_dt = _to_dt(start_time)
+        end_dt = _to_dt(end_time)
+        start_date = start_dt.strftime('%Y-%m-%d')
+        end_date = end_dt.strftime('%Y-%m-%d')
+        granularity = granularity or _cost_granularity(start_dt, end_dt)
+        cost_filter = self._rds_cost_filter(cloudera_resource_names)
+        
+        try:
+            response = self._get_cost_and_usage(
+                start_date, end_date, 'USAGE_TYPE', COST_METRICS, cost_filter, tag_key=CLOUDERA_TAG_KEY,
+                granularity=granularity)
+        except Exception as e:
+            logger.error("✗ Failed to collect cost data: %s", e)
+            response = {'ResultsByTime': []}
+        
+        cost_data = {}
+        for tag_value in cloudera_resource_names:
+            rds_detailed_costs = _collapse_tag_groups(response['ResultsByTime'], tag_value)
+            cost_data[tag_value] = {
+                'general_costs': _rds_general_costs(rds_detailed_costs),
+                'rds_detailed_costs': rds_detailed_costs,
+                'granularity': granularity
+            }
+        
+        return cost_data
+    
+    def _rds_cost_filter(self, cloudera_resource_names: Optional[List[str]] = None) -> Dict:
+        """
+        Build the Cost Explorer filter for RDS costs in the analyzer's region.
+        
+        Args:
+            cloudera_resource_names (List[str], optional): Cloudera-Resource-Name tag values to restrict costs to
+            
+        Returns:
+            Dict: Cost Explorer filter expression
+        """
         cost_filter = {
             'And': [
                 {
                     'Dimensions': {
                         'Key': 'SERVICE',
-                        'Values': ['Amazon Relational Database Service']
+                        'Values': [RDS_SERVICE]
                     }
                 },
                 {
@@ -178,182 +713,124 @@ class RDSAnalyzer:
                 }
             ]
         }
-        
-        # Add tag filter if Cloudera-Resource-Name is available
-        if cloudera_resource_name:
+        if cloudera_resource_names:
             cost_filter['And'].append({
                 'Tags': {
-                    'Key': 'Cloudera-Resource-Name',
-                    'Values': [cloudera_resource_name]
+                    'Key': CLOUDERA_TAG_KEY,
+                    'Values': list(cloudera_resource_names)
                 }
             })
-            print(f"  Using Cloudera-Resource-Name filter: {cloudera_resource_name}")
-        else:
-            print(f"  Warning: No Cloudera-Resource-Name tag found, using general RDS filter")
+        return cost_filter
+    
+    def _get_cost_and_usage(self, start_date: str, end_date: str, group_by_key: str,
+                            metrics: List[str], cost_filter: Optional[Dict] = None,
+                            tag_key: Optional[str] = None, granularity: str = 'DAILY') -> Dict:
+        """
+        Get cost and usage data grouped by a dimension, following
+        NextPageToken until every page has been collected.
         
-        try:
-            # Get cost and usage data with all available metrics
-            response = self.cost_explorer.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='DAILY',
-                Metrics=['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost', 'UsageQuantity'],
-                GroupBy=[
-                    {
-                        'Type': 'DIMENSION',
-                        'Key': 'SERVICE'
-                    }
-                ],
-                Filter=cost_filter
-            )
-            
-            # Get detailed RDS costs with same filters
-            rds_response = self.cost_explorer.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='DAILY',
-                Metrics=['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost'],
-                GroupBy=[
-                    {
-                        'Type': 'DIMENSION',
-                        'Key': 'USAGE_TYPE'
-                    }
-                ],
-                Filter=cost_filter
-            )
+        Args:
+            start_date (str): Start date in yyyy-MM-dd format
+            end_date (str): End date in yyyy-MM-dd format
+            group_by_key (str): Cost Explorer dimension to group by (e.g. SERVICE, USAGE_TYPE)
+            metrics (List[str]): Cost Explorer metrics to return
+            cost_filter (Dict, optional): Cost Explorer filter expression
+            tag_key (str, optional): Tag to group by before the dimension
+            granularity (str): Cost Explorer granularity ('DAILY' or 'MONTHLY')
             
-            # If no data with tag filter, try without tag filter as fallback
-            if not response['ResultsByTime'] and cloudera_resource_name:
-                print(f"  No data found with tag filter, trying without tag filter...")
-                # Fallback filter without tag filtering
-                fallback_filter = {
-                    'And': [
-                        {
-                            'Dimensions': {
-                                'Key': 'SERVICE',
-                                'Values': ['Amazon Relational Database Service']
-                            }
-                        },
-                        {
-                            'Dimensions': {
-                                'Key': 'REGION',
-                                'Values': [self.region]
-                            }
-                        }
-                    ]
+        Returns:
+            Dict: Cost Explorer get_cost_and_usage response with the ResultsByTime of all pages
+        """
+        kwargs = {
+            'TimePeriod': {
+                'Start': start_date,
+                'End': end_date
+            },
+            'Granularity': granularity,
+            'Metrics': metrics,
+            'GroupBy': [
+                {
+                    'Type': 'DIMENSION',
+                    'Key': group_by_key
                 }
-                
-                response = self.cost_explorer.get_cost_and_usage(
-                    TimePeriod={
-                        'Start': start_date,
-                        'End': end_date
-                    },
-                    Granularity='DAILY',
-                    Metrics=['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost', 'UsageQuantity'],
-                    GroupBy=[
-                        {
-                            'Type': 'DIMENSION',
-                            'Key': 'SERVICE'
-                        }
-                    ],
-                    Filter=fallback_filter
-                )
-                
-                rds_response = self.cost_explorer.get_cost_and_usage(
-                    TimePeriod={
-                        'Start': start_date,
-                        'End': end_date
-                    },
-                    Granularity='DAILY',
-                    Metrics=['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost'],
-                    GroupBy=[
-                        {
-                            'Type': 'DIMENSION',
-                            'Key': 'USAGE_TYPE'
-                        }
-                    ],
-                    Filter=fallback_filter
-                )
-            
-            # If still no data, try a broader date range (last 30 days)
-            if not response['ResultsByTime']:
-                print(f"  No data found for specified period, trying last 30 days...")
-                from datetime import timedelta
-                broader_start = (start_dt - timedelta(days=30)).strftime('%Y-%m-%d')
-                broader_end = end_dt.strftime('%Y-%m-%d')
-                
-                # Try with broader date range and no filters first
-                response = self.cost_explorer.get_cost_and_usage(
-                    TimePeriod={
-                        'Start': broader_start,
-                        'End': broader_end
-                    },
-                    Granularity='DAILY',
-                    Metrics=['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost', 'UsageQuantity'],
-                    GroupBy=[
-                        {
-                            'Type': 'DIMENSION',
-                            'Key': 'SERVICE'
-                        }
-                    ]
-                )
-                
-                if response['ResultsByTime']:
-                    print(f"  Found data in broader date range: {broader_start} to {broader_end}")
-                    # Filter for RDS only in the results
-                    rds_results = []
-                    for result in response['ResultsByTime']:
-                        for group in result.get('Groups', []):
-                            if group['Keys'][0] == 'Amazon Relational Database Service':
-                                rds_results.append(result)
-                                break
-                    response['ResultsByTime'] = rds_results
-            
-            print(f"  ✓ Collected cost data: {len(response['ResultsByTime'])} days")
-            
-            # Debug: Print sample response structure
-            if response['ResultsByTime']:
-                sample_result = response['ResultsByTime'][0]
-                print(f"  Debug: Sample cost result structure: {list(sample_result.keys())}")
-                if 'Total' in sample_result:
-                    print(f"  Debug: Total metrics available: {list(sample_result['Total'].keys())}")
-            
-            return {
-                'general_costs': response['ResultsByTime'],
-                'rds_detailed_costs': rds_response['ResultsByTime']
-            }
-            
-        except Exception as e:
-            print(f"  ✗ Failed to collect cost data: {str(e)}")
-            return {'general_costs': [], 'rds_detailed_costs': []}
+            ]
+        }
+        if tag_key is not None:
+            kwargs['GroupBy'].insert(0, {
+                'Type': 'TAG',
+                'Key': tag_key
+            })
+        if cost_filter is not None:
+            kwargs['Filter'] = cost_filter
+        
+        cache_path = _ce_cache_path(kwargs) if self.use_cache else None
+        if cache_path is not None and os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding='utf-8') as f:
+                    cached = json.load(f)
+                logger.info("Using cached Cost Explorer results: %s", cache_path)
+                return cached
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable Cost Explorer cache %s: %s", cache_path, e)
+        
+        response = self.cost_explorer.get_cost_and_usage(**kwargs)
+        results = response['ResultsByTime']
+        while response.get('NextPageToken'):
+            response = self.cost_explorer.get_cost_and_usage(NextPageToken=response['NextPageToken'], **kwargs)
+            for result in response['ResultsByTime']:
+                # Groups of a single day may be split across pages
+                if results and results[-1]['TimePeriod'] == result['TimePeriod']:
+                    results[-1].setdefault('Groups', []).extend(result.get('Groups', []))
+                else:
+                    results.append(result)
+        
+        response['ResultsByTime'] = results
+        response.pop('NextPageToken', None)
+        
+        # Estimated amounts can still be revised by Cost Explorer, so only
+        # results without any estimated period are cached
+        if cache_path is not None and not any(result.get('Estimated') for result in results):
+            cached = {key: value for key, value in response.items() if key != 'ResponseMetadata'}
+            try:
+                os.makedirs(CE_CACHE_DIR, exist_ok=True)
+                # Write then rename so an interrupted run never leaves a partial file
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cached, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning("Could not write Cost Explorer cache %s: %s", cache_path, e)
+        
+        return response
     
-    def get_rds_instance_info(self, db_instance_id: str) -> Dict:
+    def get_rds_instance_info(self, db_instance_id: str, refresh: bool = False) -> Dict:
         """
         Get RDS instance configuration information.
         
+        Successful lookups are cached per instance for the lifetime of the analyzer.
+        
         Args:
             db_instance_id (str): RDS DB Instance Identifier
+            refresh (bool): If True, ignore any cached result and describe the instance again
             
         Returns:
             Dict: Dictionary containing instance configuration details including Cloudera-Resource-Name tag
         """
+        if not refresh and db_instance_id in self._instance_info_cache:
+            return self._instance_info_cache[db_instance_id]
+        
         try:
             response = self.rds.describe_db_instances(DBInstanceIdentifier=db_instance_id)
             instance = response['DBInstances'][0]
             
-            # Extract Cloudera-Resource-Name tag
-            cloudera_resource_name = None
-            if 'TagList' in instance:
-                for tag in instance['TagList']:
-                    if tag['Key'] == 'Cloudera-Resource-Name':
-                        cloudera_resource_name = tag['Value']
-                        break
+            # Extract Cloudera-Resource-Name tag; DescribeDBInstances already returns
+            # the tags, so no separate tagging API request is needed
+            cloudera_resource_name = next(
+                (tag['Value'] for tag in instance.get('TagList', []) if tag['Key'] == CLOUDERA_TAG_KEY),
+                None
+            )
             
-            return {
+            instance_info = {
                 'DBInstanceClass': instance['DBInstanceClass'],
                 'Engine': instance['Engine'],
                 'EngineVersion': instance['EngineVersion'],
@@ -372,8 +849,10 @@ class RDSAnalyzer:
                 'PreferredMaintenanceWindow': instance['PreferredMaintenanceWindow'],
                 'ClouderaResourceName': cloudera_resource_name
             }
+            self._instance_info_cache[db_instance_id] = instance_info
+            return instance_info
         except Exception as e:
-            print(f"  ✗ Failed to get RDS instance info: {str(e)}")
+            logger.error("✗ Failed to get RDS instance info: %s", e)
             return {}
     
     def analyze_performance(self, metrics: Dict) -> Dict:
@@ -386,7 +865,7 @@ class RDSAnalyzer:
         Returns:
             Dict: Dictionary containing analyzed performance metrics with statistics
         """
-        print("Analyzing performance metrics...")
+        logger.info("Analyzing performance metrics...")
         
         analysis = {}
         
@@ -394,16 +873,17 @@ class RDSAnalyzer:
             if not datapoints:
                 continue
                 
-            values = [dp['Average'] for dp in datapoints if 'Average' in dp]
-            max_values = [dp['Maximum'] for dp in datapoints if 'Maximum' in dp]
-            min_values = [dp['Minimum'] for dp in datapoints if 'Minimum' in dp]
+            values = np.fromiter(
+                (dp['Average'] for dp in datapoints if 'Average' in dp),
+                dtype=np.float64
+            )
             
-            if values:
+            if values.size:
                 analysis[metric_name] = {
-                    'avg': sum(values) / len(values),
-                    'max': max(values),
-                    'min': min(values),
-                    'data_points': len(values)
+                    'avg': float(values.mean()),
+                    'max': float(values.max()),
+                    'min': float(values.min()),
+                    'data_points': values.size
                 }
         
         return analysis
@@ -418,113 +898,117 @@ class RDSAnalyzer:
         Returns:
             Dict: Dictionary containing analyzed cost data with multiple cost metrics
         """
-        print("Analyzing cost data...")
+        logger.info("Analyzing cost data...")
         
         analysis = {
-            'total_costs': {
-                'blended': 0,
-                'unblended': 0,
-                'amortized': 0,
-                'net_unblended': 0,
-                'net_amortized': 0
-            },
+            'total_costs': dict.fromkeys(METRIC_KEYS.values(), 0),
             'daily_costs': [],
             'cost_breakdown': {},
-            'available_metrics': []
+            'available_metrics': [],
+            'granularity': cost_data.get('granularity', 'DAILY'),
+            'days': 0
         }
+        available = set()
         
-        # Analyze general RDS costs
+        # Flatten general RDS costs into one record per day; totals are then
+        # summed per column by pandas instead of per day and metric
+        daily_records = []
         for result in cost_data.get('general_costs', []):
             try:
-                # Initialize daily cost structure for all metric types
-                daily_costs = {
-                    'date': result['TimePeriod']['Start'],
-                    'blended': 0,
-                    'unblended': 0,
-                    'amortized': 0,
-                    'net_unblended': 0,
-                    'net_amortized': 0
+                totals = result['Total']
+                period = result['TimePeriod']
+                # Number of days the period covers (one for DAILY results)
+                daily_record = {
+                    'date': period['Start'],
+                    'days': (date.fromisoformat(period['End']) - date.fromisoformat(period['Start'])).days
                 }
                 
-                # Check all available cost metrics
-                for metric in ['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost']:
-                    if metric in result['Total']:
-                        cost = float(result['Total'][metric]['Amount'])
-                        daily_costs[metric.lower().replace('cost', '')] = cost
-                        analysis['total_costs'][metric.lower().replace('cost', '')] += cost
-                        if metric not in analysis['available_metrics']:
-                            analysis['available_metrics'].append(metric)
+                # Check all available cost metrics, walking the returned metrics once
+                # rather than probing the response for every known metric
+                for metric, value in totals.items():
+                    metric_key = METRIC_KEYS.get(metric)
+                    if metric_key is not None:
+                        daily_record[metric_key] = float(value['Amount'])
+                        available.add(metric)
                 
                 # Use the first available cost metric for backward compatibility
-                if not analysis['available_metrics']:
-                    print(f"  Warning: No cost data found for {result['TimePeriod']['Start']}")
+                if not available:
+                    logger.warning("No cost data found for %s", result['TimePeriod']['Start'])
                     continue
                 
-                # Add to daily costs
-                analysis['daily_costs'].append(daily_costs)
+                daily_records.append(daily_record)
+                analysis['days'] += daily_record['days']
                 
             except (KeyError, ValueError, TypeError) as e:
-                print(f"  Warning: Error processing cost data for {result.get('TimePeriod', {}).get('Start', 'unknown')}: {e}")
+                logger.warning("Error processing cost data for %s: %s", result.get('TimePeriod', {}).get('Start', 'unknown'), e)
                 continue
         
-        # Analyze detailed RDS costs
+        # Report metrics in the canonical Cost Explorer order
+        analysis['available_metrics'] = [metric for metric in COST_METRICS if metric in available]
+        
+        if daily_records:
+            # Metrics missing on a given day count as zero cost
+            daily_df = pd.DataFrame(daily_records, columns=['date', 'days', *METRIC_KEYS.values()]).fillna(0)
+            analysis['total_costs'].update(daily_df[list(METRIC_KEYS.values())].sum().to_dict())
+            analysis['daily_costs'] = daily_df.to_dict('records')
+        
+        # Flatten detailed RDS costs into (usage type, metric key, cost) rows and
+        # sum them per key with a single groupby
+        usage_rows = []
         for result in cost_data.get('rds_detailed_costs', []):
             try:
                 for group in result.get('Groups', []):
                     usage_type = group['Keys'][0]
+                    group_metrics = group['Metrics']
                     
                     # Check all available cost metrics for detailed breakdown
-                    for metric in ['BlendedCost', 'UnblendedCost', 'AmortizedCost', 'NetUnblendedCost', 'NetAmortizedCost']:
-                        if metric in group['Metrics']:
-                            cost = float(group['Metrics'][metric]['Amount'])
-                            metric_key = f"{usage_type}_{metric.lower().replace('cost', '')}"
-                            if metric_key not in analysis['cost_breakdown']:
-                                analysis['cost_breakdown'][metric_key] = 0
-                            analysis['cost_breakdown'][metric_key] += cost
+                    usage_rows.extend(
+                        (usage_type, METRIC_KEYS[metric], float(value['Amount']))
+                        for metric, value in group_metrics.items()
+                        if metric in METRIC_KEYS
+                    )
                             
             except (KeyError, ValueError, TypeError) as e:
-                print(f"  Warning: Error processing detailed cost data: {e}")
+                logger.warning("Error processing detailed cost data: %s", e)
                 continue
         
+        if usage_rows:
+            usage_df = pd.DataFrame(usage_rows, columns=['usage_type', 'metric_key', 'cost'])
+            analysis['cost_breakdown'] = usage_df.groupby(['usage_type', 'metric_key'], sort=False)['cost'].sum().to_dict()
+        
         return analysis
     
-    def calculate_monthly_breakdown(self, daily_costs: List[Dict], available_metrics: List[str]) -> Dict:
+    def calculate_monthly_breakdown(self, daily_costs: List[Dict], available_metrics: List[str]) -> pd.DataFrame:
         """
-        Calculate monthly breakdown from daily costs.
+        Calculate monthly breakdown from daily (or monthly) costs.
         
         Args:
-            daily_costs (List[Dict]): List of daily cost data
+            daily_costs (List[Dict]): List of cost data per period, as in analyze_costs' daily_costs
             available_metrics (List[str]): List of available cost metrics
             
         Returns:
-            Dict: Dictionary containing monthly aggregated cost data
-        """
-        monthly_data = {}
-        
-        for daily_cost in daily_costs:
-            # Extract year-month from date (format: YYYY-MM-DD)
-            date_str = daily_cost['date']
-            year_month = date_str[:7]  # YYYY-MM
-            
-            if year_month not in monthly_data:
-                monthly_data[year_month] = {
-                    'days': 0,
-                    'blended': 0,
-                    'unblended': 0,
-                    'amortized': 0,
-                    'net_unblended': 0,
-                    'net_amortized': 0
-                }
-            
-            monthly_data[year_month]['days'] += 1
-            
-            # Sum up all cost metrics for this month
-            for metric in available_metrics:
-                metric_key = metric.lower().replace('cost', '')
-                cost_value = daily_cost.get(metric_key, 0)
-                monthly_data[year_month][metric_key] += cost_value
+            pd.DataFrame: Monthly aggregated cost data indexed by month (YYYY-MM), with a
+            'days' column of days covered and one float column per cost metric key; empty if
+            there are no daily costs
+        """
+        if not daily_costs:
+            return pd.DataFrame(columns=['days', *METRIC_KEYS.values()])
+        
+        metric_keys = [METRIC_KEYS[metric] for metric in available_metrics]
         
-        return monthly_data
+        # Metrics missing from a day count as zero cost; records without a
+        # period length are single days
+        daily_df = pd.DataFrame(daily_costs).reindex(columns=['date', 'days', *metric_keys])
+        daily_df['days'] = daily_df['days'].fillna(1)
+        daily_df = daily_df.fillna(0)
+        
+        # Group by year-month (dates are YYYY-MM-DD), keeping months in date order
+        # of first appearance; metrics that are not available stay at zero
+        grouped = daily_df.groupby(daily_df['date'].str[:7], sort=False)
+        monthly_df = grouped[metric_keys].sum().reindex(columns=list(METRIC_KEYS.values()), fill_value=0)
+        monthly_df.insert(0, 'days', grouped['days'].sum().astype(int))
+        
+        return monthly_df
     
     def export_cost_breakdowns_to_csv(self, cost_analysis: Dict, folder_name: str):
         """
@@ -534,11 +1018,10 @@ class RDSAnalyzer:
             cost_analysis (Dict): Dictionary containing analyzed cost data
             folder_name (str): Base folder name (timestamp will be added automatically)
         """
-        import csv
         import os
         from datetime import datetime
         
-        print(f"\n📊 Exporting detailed cost breakdowns to CSV files...")
+        logger.info("📊 Exporting detailed cost breakdowns to CSV files...")
         
         # Add timestamp to folder name
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -549,96 +1032,55 @@ class RDSAnalyzer:
         
         # Create output directory if it doesn't exist
         os.makedirs(timestamped_folder, exist_ok=True)
-        print(f"  📁 Creating timestamped folder: {timestamped_folder}")
+        logger.info("📁 Creating timestamped folder: %s", timestamped_folder)
         
         # Base filename for CSV files
         base_filename = os.path.join(timestamped_folder, "rds_cost_breakdown")
         
-        # 1. Daily breakdown CSV - Export day-by-day cost data
-        if cost_analysis['daily_costs']:
+        available_metrics = cost_analysis['available_metrics']
+        metric_keys = [METRIC_KEYS[metric] for metric in available_metrics]
+        # Same cell format and line endings the csv module produced
+        csv_options = {'float_format': '%.2f', 'lineterminator': '\r\n'}
+        
+        # 1. Daily breakdown CSV - Export day-by-day cost data (MONTHLY results
+        # only have the monthly breakdown)
+        monthly_results = cost_analysis.get('granularity', 'DAILY') == 'MONTHLY'
+        if cost_analysis['daily_costs'] and not monthly_results:
             daily_filename = f"{base_filename}_daily_breakdown.csv"
-            with open(daily_filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header
-                headers = ['Date'] + [metric for metric in cost_analysis['available_metrics']]
-                writer.writerow(headers)
-                
-                # Write daily data
-                for daily_cost in cost_analysis['daily_costs']:
-                    row = [daily_cost['date']]
-                    for metric in cost_analysis['available_metrics']:
-                        metric_key = metric.lower().replace('cost', '')
-                        cost_value = daily_cost.get(metric_key, 0)
-                        row.append(f"{cost_value:.2f}")
-                    writer.writerow(row)
+            daily_df = pd.DataFrame(cost_analysis['daily_costs']).reindex(columns=['date', *metric_keys])
+            daily_df[metric_keys] = daily_df[metric_keys].fillna(0).astype(float)
+            daily_df.columns = ['Date', *available_metrics]
+            _write_csv(daily_df, daily_filename, index=False, **csv_options)
             
-            print(f"  ✓ Daily breakdown exported to: {daily_filename}")
+            logger.info("✓ Daily breakdown exported to: %s", daily_filename)
         
         # 2. Monthly breakdown CSV - Export monthly aggregated cost data
         if cost_analysis['daily_costs']:
-            monthly_breakdown = self.calculate_monthly_breakdown(cost_analysis['daily_costs'], cost_analysis['available_metrics'])
-            if monthly_breakdown:
+            monthly_df = self.calculate_monthly_breakdown(cost_analysis['daily_costs'], available_metrics)
+            if not monthly_df.empty:
                 monthly_filename = f"{base_filename}_monthly_breakdown.csv"
-                with open(monthly_filename, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    
-                    # Write header
-                    headers = ['Month'] + [metric for metric in cost_analysis['available_metrics']] + ['Days']
-                    writer.writerow(headers)
-                    
-                    # Write monthly data
-                    for month, data in monthly_breakdown.items():
-                        row = [month]
-                        for metric in cost_analysis['available_metrics']:
-                            metric_key = metric.lower().replace('cost', '')
-                            cost_value = data.get(metric_key, 0)
-                            row.append(f"{cost_value:.2f}")
-                        row.append(str(data['days']))
-                        writer.writerow(row)
+                monthly_df = monthly_df[[*metric_keys, 'days']]
+                monthly_df.columns = [*available_metrics, 'Days']
+                _write_csv(monthly_df, monthly_filename, index_label='Month', **csv_options)
                 
-                print(f"  ✓ Monthly breakdown exported to: {monthly_filename}")
+                logger.info("✓ Monthly breakdown exported to: %s", monthly_filename)
         
         # 3. Usage type breakdown CSV - Export cost breakdown by RDS usage types
         if cost_analysis['cost_breakdown']:
             usage_filename = f"{base_filename}_usage_breakdown.csv"
-            with open(usage_filename, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Group by usage type
-                usage_breakdown = {}
-                for key, cost in cost_analysis['cost_breakdown'].items():
-                    if '_' in key:
-                        usage_type, cost_type = key.split('_', 1)
-                        if usage_type not in usage_breakdown:
-                            usage_breakdown[usage_type] = {}
-                        usage_breakdown[usage_type][cost_type] = cost
-                    else:
-                        if "Other" not in usage_breakdown:
-                            usage_breakdown["Other"] = {}
-                        usage_breakdown["Other"][key] = cost
-                
-                # Write header
-                headers = ['Usage Type'] + [metric for metric in cost_analysis['available_metrics']] + ['Total']
-                writer.writerow(headers)
-                
-                # Write usage data
-                for usage_type, costs in usage_breakdown.items():
-                    row = [usage_type]
-                    total_for_type = 0
-                    
-                    for metric in cost_analysis['available_metrics']:
-                        metric_key = metric.lower().replace('cost', '')
-                        cost_value = costs.get(metric_key, 0)
-                        row.append(f"{cost_value:.2f}")
-                        total_for_type += cost_value
-                    
-                    row.append(f"{total_for_type:.2f}")
-                    writer.writerow(row)
             
-            print(f"  ✓ Usage type breakdown exported to: {usage_filename}")
+            # Group by usage type
+            usage_breakdown = _group_cost_breakdown(cost_analysis['cost_breakdown'])
+            
+            usage_df = pd.DataFrame.from_dict(usage_breakdown, orient='index').reindex(columns=metric_keys)
+            usage_df = usage_df.fillna(0).astype(float)
+            usage_df['Total'] = usage_df.sum(axis=1)
+            usage_df.columns = [*available_metrics, 'Total']
+            _write_csv(usage_df, usage_filename, index_label='Usage Type', **csv_options)
+            
+            logger.info("✓ Usage type breakdown exported to: %s", usage_filename)
         
-        print(f"  📁 All CSV files exported to: {timestamped_folder}")
+        print(f"\n📁 All CSV files exported to: {timestamped_folder}")
     
     def generate_report(self, db_instance_id: str, instance_info: Dict, 
                        performance_analysis: Dict, cost_analysis: Dict) -> str:
@@ -654,17 +1096,36 @@ class RDSAnalyzer:
         Returns:
             str: Formatted report string
         """
+        return "\n".join(self.iter_report(db_instance_id, instance_info, performance_analysis, cost_analysis))
+    
+    def iter_report(self, db_instance_id: str, instance_info: Dict,
+                    performance_analysis: Dict, cost_analysis: Dict) -> Iterator[str]:
+        """
+        Generate the performance and cost report section by section.
+        
+        Each table is rendered and yielded as soon as it is built, so callers can
+        write the report out incrementally instead of holding all of it in memory.
+        
+        Args:
+            db_instance_id (str): RDS DB Instance Identifier
+            instance_info (Dict): Dictionary containing instance configuration
+            performance_analysis (Dict): Dictionary containing performance analysis
+            cost_analysis (Dict): Dictionary containing cost analysis
+            
+        Yields:
+            str: Report lines (tables are yielded as one multi-line chunk)
+        """
+        fmt_cost = "${:.2f}".format
         
-        report = []
-        report.append("=" * 80)
-        report.append(f"RDS INSTANCE ANALYSIS REPORT")
-        report.append(f"Instance ID: {db_instance_id}")
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 80)
+        yield "=" * 80
+        yield f"RDS INSTANCE ANALYSIS REPORT"
+        yield f"Instance ID: {db_instance_id}"
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield "=" * 80
         
         # Instance Information
-        report.append("\n📋 INSTANCE CONFIGURATION")
-        report.append("-" * 40)
+        yield "\n📋 INSTANCE CONFIGURATION"
+        yield "-" * 40
         if instance_info:
             info_table = [
                 ["Property", "Value"],
@@ -678,11 +1139,19 @@ class RDSAnalyzer:
                 ["Availability Zone", instance_info.get('AvailabilityZone', 'N/A')],
                 ["Cloudera Resource Name", instance_info.get('ClouderaResourceName', 'N/A')]
             ]
-            report.append(tabulate(info_table, headers="firstrow", tablefmt="grid"))
+            yield tabulate(info_table, headers="firstrow", tablefmt="grid")
+        
+        # Nothing collected yet (e.g. a newly created instance): skip the empty
+        # performance, cost and recommendation sections
+        if not performance_analysis and not cost_analysis['available_metrics']:
+            yield "\nNo performance or cost data available for the specified period"
+            yield "Note: Cost Explorer API may have up to 24-48 hour delay for recent data"
+            yield "\n" + "=" * 80
+            return
         
         # Performance Analysis
-        report.append("\n📊 PERFORMANCE METRICS")
-        report.append("-" * 40)
+        yield "\n📊 PERFORMANCE METRICS"
+        yield "-" * 40
         
         if performance_analysis:
             perf_table = [["Metric", "Average", "Maximum", "Minimum", "Data Points"]]
@@ -696,217 +1165,212 @@ class RDSAnalyzer:
                     stats['data_points']
                 ])
             
-            report.append(tabulate(perf_table, headers="firstrow", tablefmt="grid"))
+            yield tabulate(perf_table, headers="firstrow", tablefmt="grid")
             
             # Performance insights
-            report.append("\n🔍 PERFORMANCE INSIGHTS")
-            report.append("-" * 40)
+            yield "\n🔍 PERFORMANCE INSIGHTS"
+            yield "-" * 40
             
             if 'CPUUtilization' in performance_analysis:
                 cpu_avg = performance_analysis['CPUUtilization']['avg']
                 if cpu_avg > 80:
-                    report.append("⚠️  HIGH CPU UTILIZATION: Average CPU usage is above 80%")
+                    yield "⚠️  HIGH CPU UTILIZATION: Average CPU usage is above 80%"
                 elif cpu_avg > 60:
-                    report.append("⚡ MODERATE CPU UTILIZATION: Average CPU usage is above 60%")
+                    yield "⚡ MODERATE CPU UTILIZATION: Average CPU usage is above 60%"
                 else:
-                    report.append("✅ CPU UTILIZATION: Within normal range")
+                    yield "✅ CPU UTILIZATION: Within normal range"
             
             if 'DatabaseConnections' in performance_analysis:
                 conn_avg = performance_analysis['DatabaseConnections']['avg']
                 conn_max = performance_analysis['DatabaseConnections']['max']
-                report.append(f"🔗 CONNECTIONS: Average {conn_avg:.0f}, Peak {conn_max:.0f}")
+                yield f"🔗 CONNECTIONS: Average {conn_avg:.0f}, Peak {conn_max:.0f}"
             
             if 'FreeableMemory' in performance_analysis:
                 mem_avg = performance_analysis['FreeableMemory']['avg']
                 mem_gb = mem_avg / (1024**3)
-                report.append(f"💾 FREE MEMORY: Average {mem_gb:.2f} GB")
+                yield f"💾 FREE MEMORY: Average {mem_gb:.2f} GB"
         
         # Cost Analysis
-        report.append("\n💰 COST ANALYSIS")
-        report.append("-" * 40)
+        yield "\n💰 COST ANALYSIS"
+        yield "-" * 40
         
         # Show filter information
         if instance_info.get('ClouderaResourceName'):
-            report.append(f"Filtered by Cloudera-Resource-Name: {instance_info.get('ClouderaResourceName')}")
+            yield f"Filtered by Cloudera-Resource-Name: {instance_info.get('ClouderaResourceName')}"
         else:
-            report.append("Warning: No Cloudera-Resource-Name tag found - using general RDS costs")
+            yield "Warning: No Cloudera-Resource-Name tag found - using general RDS costs"
+        
+        # Resolve the analysis key of each available metric once for all tables
+        metrics_avail = cost_analysis['available_metrics']
+        metric_keys = [(metric, METRIC_KEYS[metric]) for metric in metrics_avail]
+        value_keys = [metric_key for _, metric_key in metric_keys]
+        totals = cost_analysis['total_costs']
+        daily = cost_analysis['daily_costs']
+        granularity = cost_analysis.get('granularity', 'DAILY')
+        n_periods = len(daily)
+        # Days covered by the cost periods; averages are always per day
+        n_days = cost_analysis.get('days') or n_periods
         
         # Display all available cost metrics
-        if cost_analysis['available_metrics']:
-            report.append(f"\nAvailable Cost Metrics: {', '.join(cost_analysis['available_metrics'])}")
-            
-            # Show total costs for each metric
-            cost_table = [["Cost Type", "Total Cost", "Description"]]
-            cost_descriptions = {
-                'BlendedCost': 'Average cost across consolidated billing family',
-                'UnblendedCost': 'Actual cost on the day it was charged (cash basis)',
-                'AmortizedCost': 'Cost spread across billing period (accrual basis)',
-                'NetUnblendedCost': 'Unblended cost after discounts',
-                'NetAmortizedCost': 'Amortized cost after discounts'
-            }
+        if metrics_avail:
+            yield f"\nAvailable Cost Metrics: {', '.join(metrics_avail)}"
             
-            for metric in cost_analysis['available_metrics']:
-                metric_key = metric.lower().replace('cost', '')
-                total_cost = cost_analysis['total_costs'].get(metric_key, 0)
-                description = cost_descriptions.get(metric, 'Cost metric')
-                cost_table.append([metric, f"${total_cost:.2f}", description])
+            # Show total costs for each metric, collecting the daily averages
+            # in the same pass
+            cost_headers = ["Cost Type", "Total Cost", "Description"]
+            cost_table = []
+            average_lines = []
             
-            report.append(tabulate(cost_table, headers="firstrow", tablefmt="grid"))
+            for metric, metric_key in metric_keys:
+                total_cost = totals.get(metric_key, 0)
+                description = COST_DESCRIPTIONS.get(metric, 'Cost metric')
+                cost_table.append([metric, fmt_cost(total_cost), description])
+                if daily:
+                    average_lines.append(f"  {metric}: ${total_cost / n_days:.2f}/day")
+            
+            yield _render_grid(cost_headers, cost_table)
             
             # Show daily averages
-            if cost_analysis['daily_costs']:
-                report.append(f"\nDaily Averages:")
-                for metric in cost_analysis['available_metrics']:
-                    metric_key = metric.lower().replace('cost', '')
-                    total_cost = cost_analysis['total_costs'].get(metric_key, 0)
-                    daily_avg = total_cost / len(cost_analysis['daily_costs'])
-                    report.append(f"  {metric}: ${daily_avg:.2f}/day")
-                
-                # Detailed Daily Breakdown
-                report.append(f"\n📅 DETAILED DAILY BREAKDOWN")
-                report.append("-" * 50)
-                
-                # Create daily breakdown table
-                daily_headers = ["Date"] + [metric for metric in cost_analysis['available_metrics']]
-                daily_table = [daily_headers]
+            if daily:
+                yield f"\nDaily Averages:"
+                yield from average_lines
                 
-                for daily_cost in cost_analysis['daily_costs']:
-                    row = [daily_cost['date']]
-                    for metric in cost_analysis['available_metrics']:
-                        metric_key = metric.lower().replace('cost', '')
-                        cost_value = daily_cost.get(metric_key, 0)
-                        row.append(f"${cost_value:.2f}")
-                    daily_table.append(row)
-                
-                report.append(tabulate(daily_table, headers="firstrow", tablefmt="grid"))
+                # Detailed Daily Breakdown (MONTHLY results only have the monthly breakdown)
+                if granularity == 'DAILY':
+                    yield f"\n📅 DETAILED DAILY BREAKDOWN"
+                    yield "-" * 50
+                    
+                    # Create daily breakdown table
+                    daily_headers = ["Date"] + metrics_avail
+                    daily_table = [
+                        [daily_cost['date'], *(fmt_cost(daily_cost.get(metric_key, 0)) for metric_key in value_keys)]
+                        for daily_cost in daily
+                    ]
+                    
+                    yield _render_grid(daily_headers, daily_table)
                 
                 # Monthly breakdown
-                monthly_breakdown = self.calculate_monthly_breakdown(cost_analysis['daily_costs'], cost_analysis['available_metrics'])
-                if monthly_breakdown:
-                    report.append(f"\n📊 MONTHLY BREAKDOWN")
-                    report.append("-" * 50)
+                monthly_df = self.calculate_monthly_breakdown(daily, metrics_avail)
+                if not monthly_df.empty:
+                    yield f"\n📊 MONTHLY BREAKDOWN"
+                    yield "-" * 50
                     
-                    monthly_headers = ["Month"] + [metric for metric in cost_analysis['available_metrics']] + ["Days"]
-                    monthly_table = [monthly_headers]
-                    
-                    for month, data in monthly_breakdown.items():
-                        row = [month]
-                        for metric in cost_analysis['available_metrics']:
-                            metric_key = metric.lower().replace('cost', '')
-                            cost_value = data.get(metric_key, 0)
-                            row.append(f"${cost_value:.2f}")
-                        row.append(str(data['days']))
-                        monthly_table.append(row)
+                    monthly_headers = ["Month"] + metrics_avail + ["Days"]
+                    monthly_table = [
+                        [month, *map(fmt_cost, costs), str(days)]
+                        for month, *costs, days in monthly_df[[*value_keys, 'days']].itertuples()
+                    ]
                     
-                    report.append(tabulate(monthly_table, headers="firstrow", tablefmt="grid"))
+                    yield _render_grid(monthly_headers, monthly_table)
             
             # Show detailed cost breakdown
             if cost_analysis['cost_breakdown']:
-                report.append("\n🔍 DETAILED COST BREAKDOWN BY USAGE TYPE")
-                report.append("-" * 60)
+                yield "\n🔍 DETAILED COST BREAKDOWN BY USAGE TYPE"
+                yield "-" * 60
                 
                 # Group by usage type
-                usage_breakdown = {}
-                for key, cost in cost_analysis['cost_breakdown'].items():
-                    if '_' in key:
-                        usage_type, cost_type = key.split('_', 1)
-                        if usage_type not in usage_breakdown:
-                            usage_breakdown[usage_type] = {}
-                        usage_breakdown[usage_type][cost_type] = cost
-                    else:
-                        if "Other" not in usage_breakdown:
-                            usage_breakdown["Other"] = {}
-                        usage_breakdown["Other"][key] = cost
+                usage_breakdown = _group_cost_breakdown(cost_analysis['cost_breakdown'])
                 
                 # Create detailed breakdown table
-                breakdown_headers = ["Usage Type"] + [metric for metric in cost_analysis['available_metrics']] + ["Total"]
-                breakdown_table = [breakdown_headers]
+                breakdown_headers = ["Usage Type"] + metrics_avail + ["Total"]
+                breakdown_table = []
                 
                 for usage_type, costs in usage_breakdown.items():
-                    row = [usage_type]
-                    total_for_type = 0
-                    
-                    for metric in cost_analysis['available_metrics']:
-                        metric_key = metric.lower().replace('cost', '')
-                        cost_value = costs.get(metric_key, 0)
-                        row.append(f"${cost_value:.2f}")
-                        total_for_type += cost_value
-                    
-                    row.append(f"${total_for_type:.2f}")
-                    breakdown_table.append(row)
+                    values = [costs.get(metric_key, 0) for metric_key in value_keys]
+                    breakdown_table.append(
+                        [usage_type, *map(fmt_cost, values), fmt_cost(sum(values))]
+                    )
                 
-                report.append(tabulate(breakdown_table, headers="firstrow", tablefmt="grid"))
+                yield _render_grid(breakdown_headers, breakdown_table)
                 
                 # Add cost trend analysis
-                if len(cost_analysis['daily_costs']) > 1:
-                    report.append(f"\n📈 COST TREND ANALYSIS")
-                    report.append("-" * 40)
+                if n_periods > 1:
+                    yield f"\n📈 COST TREND ANALYSIS"
+                    yield "-" * 40
                     
                     # Calculate trend for primary cost metric
-                    primary_metric = cost_analysis['available_metrics'][0] if cost_analysis['available_metrics'] else 'UnblendedCost'
-                    metric_key = primary_metric.lower().replace('cost', '')
+                    primary_metric = metrics_avail[0] if metrics_avail else 'UnblendedCost'
+                    metric_key = METRIC_KEYS[primary_metric]
                     
-                    first_day_cost = cost_analysis['daily_costs'][0].get(metric_key, 0)
-                    last_day_cost = cost_analysis['daily_costs'][-1].get(metric_key, 0)
+                    # Fit a line through every period rather than comparing only the first
+                    # and last one; the fitted change over the window is reported relative
+                    # to the average daily cost. Each period's cost is taken per day so
+                    # partial and short months do not read as a change in spend
+                    values = np.fromiter((d.get(metric_key, 0) / (d.get('days') or 1) for d in daily),
+                                         dtype=np.float64, count=n_periods)
+                    slope, _ = np.polyfit(np.arange(n_periods), values, 1)
+                    mean_cost = values.mean()
                     
-                    if first_day_cost > 0:
-                        trend_percent = ((last_day_cost - first_day_cost) / first_day_cost) * 100
+                    # Costs below half a cent show as $0.00 and would yield meaningless percentages
+                    if mean_cost > 0.005:
+                        # Rounded first so float noise on a flat series reads as stable
+                        trend_percent = round(float(slope * (n_periods - 1) / mean_cost * 100), 1)
                         trend_direction = "increased" if trend_percent > 0 else "decreased" if trend_percent < 0 else "remained stable"
-                        report.append(f"• {primary_metric} {trend_direction} by {abs(trend_percent):.1f}% from first to last day")
+                        yield f"• {primary_metric} {trend_direction} by {abs(trend_percent):.1f}% over the period (linear trend)"
                     
                     # Calculate average daily cost
-                    total_days = len(cost_analysis['daily_costs'])
-                    avg_daily = cost_analysis['total_costs'].get(metric_key, 0) / total_days
-                    report.append(f"• Average daily {primary_metric}: ${avg_daily:.2f}")
+                    avg_daily = totals.get(metric_key, 0) / n_days
+                    yield f"• Average daily {primary_metric}: ${avg_daily:.2f}"
                     
                     # Calculate projected monthly cost
                     projected_monthly = avg_daily * 30
-                    report.append(f"• Projected monthly {primary_metric}: ${projected_monthly:.2f}")
+                    yield f"• Projected monthly {primary_metric}: ${projected_monthly:.2f}"
         else:
-            report.append("No cost data available for the specified period")
-            report.append("Note: Cost Explorer API may have up to 24-48 hour delay for recent data")
+            yield "No cost data available for the specified period"
+            yield "Note: Cost Explorer API may have up to 24-48 hour delay for recent data"
         
         # Recommendations
-        report.append("\n💡 RECOMMENDATIONS")
-        report.append("-" * 40)
+        yield "\n💡 RECOMMENDATIONS"
+        yield "-" * 40
         
         if performance_analysis:
             if 'CPUUtilization' in performance_analysis and performance_analysis['CPUUtilization']['avg'] > 80:
-                report.append("• Consider upgrading to a larger instance class for better CPU performance")
+                yield "• Consider upgrading to a larger instance class for better CPU performance"
             
             if 'FreeableMemory' in performance_analysis:
                 mem_avg = performance_analysis['FreeableMemory']['avg']
                 if mem_avg < 100 * 1024 * 1024:  # Less than 100MB
-                    report.append("• Low free memory detected - consider instance upgrade or query optimization")
+                    yield "• Low free memory detected - consider instance upgrade or query optimization"
             
             if 'DatabaseConnections' in performance_analysis:
                 conn_max = performance_analysis['DatabaseConnections']['max']
                 if conn_max > 100:
-                    report.append("• High connection count detected - review connection pooling and application logic")
+                    yield "• High connection count detected - review connection pooling and application logic"
         
         # Cost-based recommendations
-        if cost_analysis['available_metrics']:
+        if metrics_avail:
             # Use UnblendedCost as the primary metric for recommendations
-            primary_cost = cost_analysis['total_costs'].get('unblended', 0)
+            primary_cost = totals.get('unblended', 0)
             if primary_cost == 0:
-                primary_cost = cost_analysis['total_costs'].get('blended', 0)
+                primary_cost = totals.get('blended', 0)
             
             if primary_cost > 100:
-                report.append("• Consider Reserved Instances for cost optimization if usage is predictable")
+                yield "• Consider Reserved Instances for cost optimization if usage is predictable"
             
             # Compare different cost metrics for insights
-            if 'BlendedCost' in cost_analysis['available_metrics'] and 'UnblendedCost' in cost_analysis['available_metrics']:
-                blended_total = cost_analysis['total_costs'].get('blended', 0)
-                unblended_total = cost_analysis['total_costs'].get('unblended', 0)
+            if 'BlendedCost' in metrics_avail and 'UnblendedCost' in metrics_avail:
+                blended_total = totals.get('blended', 0)
+                unblended_total = totals.get('unblended', 0)
                 if blended_total > 0 and unblended_total > 0:
                     diff_percent = ((blended_total - unblended_total) / unblended_total) * 100
                     if abs(diff_percent) > 10:
-                        report.append(f"• Significant difference between Blended (${blended_total:.2f}) and Unblended (${unblended_total:.2f}) costs: {diff_percent:+.1f}%")
-                        report.append("  This may indicate Reserved Instance or Savings Plan usage")
+                        yield f"• Significant difference between Blended (${blended_total:.2f}) and Unblended (${unblended_total:.2f}) costs: {diff_percent:+.1f}%"
+                        yield "  This may indicate Reserved Instance or Savings Plan usage"
         
-        report.append("\n" + "=" * 80)
-        
-        return "\n".join(report)
+        yield "\n" + "=" * 80
+
+
+class _Tee:
+    """
+    Minimal writable that forwards every write to several streams.
+    """
+    
+    def __init__(self, *streams):
+        self.streams = streams
+    
+    def write(self, data: str) -> None:
+        for stream in self.streams:
+            stream.write(data)
 
 
 def main():
@@ -937,9 +1401,23 @@ Examples:
                        help='Output file to save the report (optional)')
     parser.add_argument('--export-csv', 
                        help='Export detailed cost breakdowns to CSV files. Specify folder name (timestamp will be added automatically)')
+    parser.add_argument('--allow-broader-range', action='store_true',
+                       help='If no cost data is found, also search the 30 days before the start time')
+    parser.add_argument('--granularity', choices=['DAILY', 'MONTHLY'],
+                       help=f'Cost Explorer granularity (default: MONTHLY for windows over {MONTHLY_GRANULARITY_MIN_DAYS} days, DAILY otherwise)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always query Cost Explorer instead of reusing cached results for windows older than 48 hours')
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help='Logging level for progress, warnings and errors written to stderr '
+                            '(default: INFO on a terminal, WARNING otherwise)')
     
     args = parser.parse_args()
     
+    # Progress, warnings and errors go through logging to stderr; stdout only
+    # carries the report and the paths of the files written
+    log_level = args.log_level or ('INFO' if sys.stderr.isatty() else 'WARNING')
+    logging.basicConfig(level=log_level, format='  %(message)s')
+    
     # Validate and format datetime strings
     try:
         # Handle different datetime formats
@@ -948,57 +1426,68 @@ Examples:
         if 'T' not in args.end_time:
             args.end_time += 'T23:59:59Z'
         
-        # Validate datetime format
-        datetime.fromisoformat(args.start_time.replace('Z', '+00:00'))
-        datetime.fromisoformat(args.end_time.replace('Z', '+00:00'))
+        # Validate datetime format; the parsed datetimes are passed on so they
+        # are not re-parsed by every collector
+        start_dt = _to_dt(args.start_time)
+        end_dt = _to_dt(args.end_time)
         
     except ValueError as e:
-        print(f"Error: Invalid datetime format. {e}")
-        print("Use format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ")
+        logger.error("Error: Invalid datetime format. %s", e)
+        logger.error("Use format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ")
         sys.exit(1)
     
     try:
         # Initialize analyzer
-        analyzer = RDSAnalyzer(args.region)
-        
-        # Get RDS instance information
-        print(f"Getting RDS instance information for {args.db_instance_id}...")
-        instance_info = analyzer.get_rds_instance_info(args.db_instance_id)
+        analyzer = RDSAnalyzer(args.region, use_cache=not args.no_cache)
         
-        # Collect performance metrics
-        metrics = analyzer.get_rds_metrics(args.db_instance_id, args.start_time, args.end_time)
-        
-        # Collect cost data with Cloudera-Resource-Name filter
-        cloudera_resource_name = instance_info.get('ClouderaResourceName')
-        cost_data = analyzer.get_cost_data(args.db_instance_id, args.start_time, args.end_time, cloudera_resource_name)
+        # CloudWatch metrics do not depend on the instance info, so they are
+        # collected on a worker thread while this thread describes the instance
+        # and fetches its costs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            metrics_future = executor.submit(analyzer.get_rds_metrics, args.db_instance_id, start_dt, end_dt)
+            
+            # Get RDS instance information
+            logger.info("Getting RDS instance information for %s...", args.db_instance_id)
+            instance_info = analyzer.get_rds_instance_info(args.db_instance_id)
+            
+            # Collect cost data with Cloudera-Resource-Name filter
+            cloudera_resource_name = instance_info.get('ClouderaResourceName')
+            cost_data = analyzer.get_cost_data(args.db_instance_id, start_dt, end_dt, cloudera_resource_name,
+                                               allow_broader_range=args.allow_broader_range,
+                                               granularity=args.granularity)
+            
+            metrics = metrics_future.result()
         
         # Analyze data
         performance_analysis = analyzer.analyze_performance(metrics)
         cost_analysis = analyzer.analyze_costs(cost_data)
         
-        # Generate report
-        report = analyzer.generate_report(
+        # Generate report, streaming each section to stdout and the output file
+        report_lines = analyzer.iter_report(
             args.db_instance_id, 
             instance_info, 
             performance_analysis, 
             cost_analysis
         )
         
-        # Output report
-        print("\n" + report)
-        
-        # Save to file if requested
+        sys.stdout.write("\n")
         if args.output_file:
-            with open(args.output_file, 'w') as f:
-                f.write(report)
+            # Explicit UTF-8 so the emoji section headers also save on Windows
+            with open(args.output_file, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+                out = _Tee(sys.stdout, f)
+                for line in report_lines:
+                    out.write(line + "\n")
             print(f"\nReport saved to: {args.output_file}")
+        else:
+            for line in report_lines:
+                sys.stdout.write(line + "\n")
         
         # Export CSV files if requested
         if args.export_csv:
             analyzer.export_cost_breakdowns_to_csv(cost_analysis, args.export_csv)
         
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 
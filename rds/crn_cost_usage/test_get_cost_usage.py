@@ -0,0 +1,61 @@
+"""Tests for the batch cost collection of get_cost_usage.py"""
+
+import unittest
+from unittest import mock
+
+import get_cost_usage
+from get_cost_usage import CLOUDERA_TAG_KEY, RDSAnalyzer
+
+DAYS = ('2024-01-01', '2024-01-02', '2024-01-03')
+
+
+def _cost_response(tag_values):
+    """Cost Explorer response with one instance usage group per tag value and day"""
+    return {
+        'ResultsByTime': [
+            {
+                'TimePeriod': {'Start': day, 'End': end},
+                'Total': {},
+                'Groups': [
+                    {
+                        'Keys': [f'{CLOUDERA_TAG_KEY}${tag_value}', 'USE1-InstanceUsage:db.r5.large'],
+                        'Metrics': {'UnblendedCost': {'Amount': '2.5', 'Unit': 'USD'}},
+                    }
+                    for tag_value in tag_values
+                ],
+                'Estimated': False,
+            }
+            for day, end in zip(DAYS, (*DAYS[1:], '2024-01-04'))
+        ]
+    }
+
+
+class GetCostDataBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.ce = mock.Mock()
+        self.ce.get_cost_and_usage.side_effect = lambda **kwargs: _cost_response(['crn-a'])
+        patcher = mock.patch.object(get_cost_usage, '_client', lambda service, region: self.ce)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.analyzer = RDSAnalyzer('us-east-1')
+
+    def test_missing_tag_gets_no_costs_for_any_number_of_names(self):
+        single = self.analyzer.get_cost_data_batch(['crn-missing'], '2024-01-01', '2024-01-04')
+        several = self.analyzer.get_cost_data_batch(['crn-missing', 'crn-a'], '2024-01-01', '2024-01-04')
+
+        self.assertEqual(single['crn-missing']['general_costs'], [])
+        self.assertEqual(several['crn-missing']['general_costs'], [])
+        self.assertEqual(len(several['crn-a']['general_costs']), 3)
+
+    def test_granularity(self):
+        cost_data = self.analyzer.get_cost_data_batch(['crn-a'], '2024-01-01', '2024-01-04', granularity='MONTHLY')
+
+        self.assertEqual(cost_data['crn-a']['granularity'], 'MONTHLY')
+        self.assertEqual(self.ce.get_cost_and_usage.call_args.kwargs['Granularity'], 'MONTHLY')
+
+        cost_data = self.analyzer.get_cost_data_batch(['crn-a'], '2024-01-01', '2024-01-04')
+        self.assertEqual(cost_data['crn-a']['granularity'], 'DAILY')
+
+
+if __name__ == '__main__':
+    unittest.main()